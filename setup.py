@@ -37,6 +37,8 @@ test_requires = [
 
 if sys.version_info[0] is 3:
     test_requires.append("bump2version>=1.0,<2.0")
+    test_requires.append("orjson>=3.0,<4.0")
+    test_requires.append("pysimdjson>=3.0,<7.0")
 
 if is_coap_supported():
     install_requires.append('aiocoap[linkheader]==0.4a1')
@@ -81,6 +83,8 @@ setup(
     install_requires=install_requires,
     extras_require={
         'tests': test_requires,
-        'uvloop': ['uvloop>=0.12.2,<0.13.0']
+        'uvloop': ['uvloop>=0.12.2,<0.13.0'],
+        'orjson': ['orjson>=3.0,<4.0'],
+        'simdjson': ['pysimdjson>=3.0,<7.0']
     }
 )
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from wotpy.utils import serialization
+
+BACKENDS = ["stdlib", "orjson", "simdjson"]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    """Forces the serialization helpers to use each of the available JSON backends."""
+
+    if request.param == "stdlib":
+        monkeypatch.setattr(serialization, "orjson", None)
+        monkeypatch.setattr(serialization, "simdjson", None)
+    elif request.param == "orjson":
+        monkeypatch.setattr(serialization, "orjson", pytest.importorskip("orjson"))
+    elif request.param == "simdjson":
+        monkeypatch.setattr(serialization, "orjson", None)
+        monkeypatch.setattr(serialization, "simdjson", pytest.importorskip("simdjson"))
+
+    return request.param
+
+
+def test_json_dumps_wrapped(backend):
+    """Values can be serialized to bytes wrapped in a JSON object with a single key."""
+
+    values = [
+        None,
+        100,
+        u"áéíóú",
+        [1, u"two", 3.0, None],
+        {u"nested": {u"list": [True, False]}}
+    ]
+
+    for key in [u"input", u"id", u"value"]:
+        for value in values:
+            serialized = serialization.json_dumps_wrapped(key, value)
+            assert isinstance(serialized, bytes)
+            assert json.loads(serialized.decode("utf-8")) == {key: value}
+
+
+def test_json_loads_fields(backend):
+    """Only the requested top-level fields are deserialized to plain Python objects."""
+
+    doc = {
+        u"value": {u"nested": [1, {u"deep": u"áéíóú"}]},
+        u"items": [1, 2, 3],
+        u"done": True,
+        u"error": None,
+        u"ignored": u"ignored"
+    }
+
+    keys = (u"value", u"items", u"done", u"error", u"missing")
+    expected = {key: doc[key] for key in keys if key in doc}
+
+    data_bytes = json.dumps(doc).encode("utf-8")
+    data_unicode = data_bytes.decode("utf-8")
+
+    fields_bytes = serialization.json_loads_fields(data_bytes, keys)
+    fields_unicode = serialization.json_loads_fields(data_unicode, keys)
+
+    assert fields_bytes == expected
+    assert fields_unicode == expected
+    assert type(fields_bytes[u"value"]) is dict
+    assert type(fields_bytes[u"items"]) is list
+    assert serialization.json_loads_fields(b"{}", keys) == {}
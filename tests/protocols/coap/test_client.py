@@ -1,6 +1,16 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import asyncio
+import functools
+
+import aiocoap
+import pytest
+import six
+import tornado.concurrent
+import tornado.gen
+from rx import Observable
+
 from tests.protocols.helpers import \
     client_test_on_property_change, \
     client_test_on_event, \
@@ -9,7 +19,11 @@ from tests.protocols.helpers import \
     client_test_invoke_action, \
     client_test_invoke_action_error, \
     client_test_on_property_change_error
+from tests.utils import run_test_coroutine
 from wotpy.protocols.coap.client import CoAPClient
+from wotpy.protocols.coap.enums import CoAPBackpressure
+from wotpy.wot.servient import Servient
+from wotpy.wot.td import ThingDescription
 
 
 def test_read_property(coap_servient):
@@ -30,6 +44,88 @@ def test_on_property_change(coap_servient):
     client_test_on_property_change(coap_servient, CoAPClient)
 
 
+@pytest.mark.parametrize("backpressure", CoAPBackpressure.list())
+def test_on_property_change_backpressure(coap_servient, backpressure):
+    """The CoAP client delivers property updates with any backpressure policy and a minimal buffer."""
+
+    client_cls = functools.partial(CoAPClient, backpressure=backpressure, max_buffer=1)
+    client_test_on_property_change(coap_servient, client_cls)
+
+
+class _BurstObservation(object):
+    """Fake aiocoap observation that yields all its notifications without
+    giving control back to the event loop in between."""
+
+    def __init__(self, payloads):
+        self._payloads = payloads
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    async def _iter(self):
+        for payload in self._payloads:
+            yield aiocoap.Message(code=aiocoap.Code.CONTENT, payload=payload)
+
+    def __aiter__(self):
+        return self._iter()
+
+
+class _BurstRequest(object):
+    """Fake aiocoap observation request for a burst of notifications."""
+
+    def __init__(self, payloads):
+        self.response = self._first_response(payloads[0])
+        self.observation = _BurstObservation(payloads[1:])
+
+    @staticmethod
+    async def _first_response(payload):
+        return aiocoap.Message(code=aiocoap.Code.CONTENT, payload=payload)
+
+
+class _BurstContext(object):
+    """Fake aiocoap client context that answers observations with a burst of notifications."""
+
+    def __init__(self, payloads):
+        self._payloads = payloads
+
+    def request(self, msg):
+        return _BurstRequest(self._payloads)
+
+
+@pytest.mark.parametrize("backpressure", CoAPBackpressure.list())
+def test_subscribe_backpressure_burst(backpressure):
+    """Bursts of updates larger than the buffer drop the oldest items
+    with the DROP policy and are delivered in order with the BUFFER policy."""
+
+    max_buffer = 3
+    payloads = [six.text_type(idx).encode("utf-8") for idx in range(max_buffer * 4)]
+
+    coap_client = CoAPClient(backpressure=backpressure, max_buffer=max_buffer)
+    coap_client._coap_client = _BurstContext(payloads)
+
+    subscribe = coap_client._build_subscribe("coap://localhost/observable", lambda payload: payload)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        received = []
+        future_done = tornado.concurrent.Future()
+
+        Observable.create(subscribe).subscribe(
+            on_next=received.append,
+            on_error=future_done.set_exception,
+            on_completed=lambda: future_done.set_result(True))
+
+        yield future_done
+
+        if backpressure == CoAPBackpressure.DROP:
+            assert received == payloads[-max_buffer:]
+        else:
+            assert received == payloads
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_on_property_change_error(coap_servient):
     """Errors that arise in the middle of an ongoing Property
     observation are propagated to the subscription as expected."""
@@ -53,3 +149,57 @@ def test_on_event(coap_servient):
     """The CoAP client can subscribe to event emissions."""
 
     client_test_on_event(coap_servient, CoAPClient)
+
+
+def test_shared_client_context(coap_servient):
+    """The CoAP client reuses the same aiocoap context across requests until shutdown."""
+
+    exposed_thing = next(coap_servient.exposed_things)
+    prop_name = next(six.iterkeys(exposed_thing.properties))
+    td = ThingDescription.from_thing(exposed_thing.thing)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        coap_client = CoAPClient()
+
+        yield coap_client.read_property(td, prop_name)
+        context = coap_client._coap_client
+        assert context is not None
+
+        yield coap_client.read_property(td, prop_name)
+        assert coap_client._coap_client is context
+
+        future_shutdown = coap_client.shutdown()
+        assert isinstance(future_shutdown, asyncio.Future)
+        yield future_shutdown
+        assert coap_client._coap_client is None
+
+        yield coap_client.read_property(td, prop_name)
+        assert coap_client._coap_client is not None
+        assert coap_client._coap_client is not context
+
+        yield coap_client.shutdown()
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_servient_shutdown_client_context(coap_servient):
+    """The shared aiocoap context is released when the Servient that holds the client shuts down."""
+
+    exposed_thing = next(coap_servient.exposed_things)
+    prop_name = next(six.iterkeys(exposed_thing.properties))
+    td = ThingDescription.from_thing(exposed_thing.thing)
+
+    coap_client = CoAPClient()
+    servient = Servient(catalogue_port=None, clients=[coap_client])
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        yield servient.start()
+        yield coap_client.read_property(td, prop_name)
+        assert coap_client._coap_client is not None
+
+        yield servient.shutdown()
+        assert coap_client._coap_client is None
+
+    run_test_coroutine(test_coroutine)
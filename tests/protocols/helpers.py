@@ -64,6 +64,8 @@ def client_test_on_property_change(servient, protocol_client_cls):
         periodic_emit.stop()
         subscription.dispose()
 
+        yield protocol_client.shutdown()
+
     run_test_coroutine(test_coroutine)
 
 
@@ -110,6 +112,8 @@ def client_test_on_event(servient, protocol_client_cls):
         periodic_emit.stop()
         subscription.dispose()
 
+        yield protocol_client.shutdown()
+
     run_test_coroutine(test_coroutine)
 
 
@@ -144,6 +148,8 @@ def client_test_read_property(servient, protocol_client_cls, timeout=None):
 
         assert curr_prop_value == prop_value
 
+        yield protocol_client.shutdown()
+
     run_test_coroutine(test_coroutine)
 
 
@@ -176,6 +182,8 @@ def client_test_write_property(servient, protocol_client_cls, timeout=None):
         curr_value = yield exposed_thing.properties[prop_name].read()
         assert curr_value == prop_value
 
+        yield protocol_client.shutdown()
+
     run_test_coroutine(test_coroutine)
 
 
@@ -212,6 +220,8 @@ def client_test_invoke_action(servient, protocol_client_cls, timeout=None):
 
         assert result == result_expected
 
+        yield protocol_client.shutdown()
+
     run_test_coroutine(test_coroutine)
 
 
@@ -247,6 +257,8 @@ def client_test_invoke_action_error(servient, protocol_client_cls):
         except Exception as ex:
             assert err_message in str(ex)
 
+        yield protocol_client.shutdown()
+
     run_test_coroutine(test_coroutine)
 
 
@@ -297,4 +309,6 @@ def client_test_on_property_change_error(servient, protocol_client_cls):
 
         subscription.dispose()
 
+        yield protocol_client.shutdown()
+
     run_test_coroutine(test_coroutine)
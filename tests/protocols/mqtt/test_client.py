@@ -8,6 +8,7 @@ import pytest
 import six
 import tornado.gen
 from faker import Faker
+from hbmqtt.client import ConnectException
 from mock import MagicMock, patch
 
 from tests.protocols.helpers import \
@@ -117,6 +118,96 @@ def _build_hbmqtt_mock(side_effect_deliver_message):
     return mock_cls
 
 
+def test_connect_error_not_reused(mqtt_servient):
+    """A client that failed to connect to the broker is discarded instead of being reused by later requests."""
+
+    exposed_thing = next(mqtt_servient.exposed_things)
+    action_name = next(six.iterkeys(exposed_thing.actions))
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    mqtt_mock = _build_hbmqtt_mock(_effect_raise_timeout)
+
+    state = {"fail": True}
+
+    # noinspection PyUnusedLocal
+    def _effect_connect(*args, **kwargs):
+        if not state["fail"]:
+            return _effect_dummy()
+
+        state["fail"] = False
+
+        @tornado.gen.coroutine
+        def _coro():
+            yield tornado.gen.moment
+            raise ConnectException
+
+        return _coro()
+
+    mqtt_mock.return_value.connect.side_effect = _effect_connect
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        with patch('wotpy.protocols.mqtt.client.hbmqtt.client.MQTTClient', new=mqtt_mock):
+            mqtt_client = MQTTClient()
+
+            with pytest.raises(ConnectException):
+                yield mqtt_client.invoke_action(td, action_name, Faker().pystr(), timeout=0.1)
+
+            assert not len(mqtt_client._clients)
+
+            with pytest.raises(ClientRequestTimeout):
+                yield mqtt_client.invoke_action(td, action_name, Faker().pystr(), timeout=0.1)
+
+            assert len(mqtt_client._clients) == 1
+            assert mqtt_mock.return_value.connect.call_count == 2
+
+            yield mqtt_client.shutdown()
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_shutdown_client_in_use():
+    """Shutting down the client defers the disconnection of brokers that are still in use."""
+
+    mqtt_mock = _build_hbmqtt_mock(_effect_raise_timeout)
+    broker_url = "mqtt://{}".format(Faker().domain_name())
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        with patch('wotpy.protocols.mqtt.client.hbmqtt.client.MQTTClient', new=mqtt_mock):
+            mqtt_client = MQTTClient()
+
+            yield mqtt_client._init_client(broker_url, "ref-a")
+            yield mqtt_client._init_client(broker_url, "ref-b")
+            yield mqtt_client.shutdown()
+
+            assert broker_url in mqtt_client._clients
+            assert not mqtt_mock.return_value.disconnect.called
+
+            yield mqtt_client._release_client(broker_url, "ref-a")
+
+            assert broker_url in mqtt_client._clients
+
+            yield mqtt_client._release_client(broker_url, "ref-b")
+
+            assert broker_url not in mqtt_client._clients
+            assert mqtt_mock.return_value.disconnect.call_count == 1
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_next_id_fork():
+    """Correlation IDs generated after a fork do not collide with those of the parent process."""
+
+    id_parent = MQTTClient._next_id()
+
+    with patch('wotpy.protocols.mqtt.client.os.getpid', return_value=MQTTClient._id_pid + 1):
+        ids_child = [MQTTClient._next_id() for _ in range(10)]
+
+    assert id_parent not in ids_child
+    assert len(set(ids_child)) == len(ids_child)
+    assert id_parent.rsplit("-", 1)[0] != ids_child[0].rsplit("-", 1)[0]
+
+
 def test_timeout_invoke_action(mqtt_servient):
     """Timeouts can be defined on Action invocations."""
 
@@ -135,6 +226,8 @@ def test_timeout_invoke_action(mqtt_servient):
             with pytest.raises(ClientRequestTimeout):
                 yield mqtt_client.invoke_action(td, action_name, Faker().pystr(), timeout=timeout)
 
+            yield mqtt_client.shutdown()
+
     run_test_coroutine(test_coroutine)
 
 
@@ -156,6 +249,8 @@ def test_timeout_read_property(mqtt_servient):
             with pytest.raises(ClientRequestTimeout):
                 yield mqtt_client.read_property(td, prop_name, timeout=timeout)
 
+            yield mqtt_client.shutdown()
+
     run_test_coroutine(test_coroutine)
 
 
@@ -177,6 +272,8 @@ def test_timeout_write_property(mqtt_servient):
             with pytest.raises(ClientRequestTimeout):
                 yield mqtt_client.write_property(td, prop_name, Faker().pystr(), timeout=timeout)
 
+            yield mqtt_client.shutdown()
+
     run_test_coroutine(test_coroutine)
 
 
@@ -201,4 +298,87 @@ def test_stop_timeout(mqtt_servient):
             with pytest.raises(ClientRequestTimeout):
                 yield mqtt_client.read_property(td, prop_name, timeout=timeout)
 
+            yield mqtt_client.shutdown()
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_client_reuse(mqtt_servient):
+    """Connections to the broker are kept open and reused across requests until shutdown."""
+
+    exposed_thing = next(mqtt_servient.exposed_things)
+    prop_name = next(six.iterkeys(exposed_thing.properties))
+    td = ThingDescription.from_thing(exposed_thing.thing)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        mqtt_client = MQTTClient()
+
+        yield mqtt_client.read_property(td, prop_name)
+
+        assert len(mqtt_client._clients) == 1
+        hbmqtt_client = next(six.itervalues(mqtt_client._clients))
+
+        yield mqtt_client.write_property(td, prop_name, Faker().pyint())
+        yield mqtt_client.read_property(td, prop_name)
+
+        assert len(mqtt_client._clients) == 1
+        assert next(six.itervalues(mqtt_client._clients)) is hbmqtt_client
+
+        yield mqtt_client.shutdown()
+
+        assert not len(mqtt_client._clients)
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_methods_return_futures(mqtt_servient):
+    """The public request methods of the MQTT client return Futures that run without being awaited."""
+
+    exposed_thing = next(mqtt_servient.exposed_things)
+    prop_name = next(six.iterkeys(exposed_thing.properties))
+    td = ThingDescription.from_thing(exposed_thing.thing)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        mqtt_client = MQTTClient()
+
+        future_write = mqtt_client.write_property(td, prop_name, Faker().pyint())
+        assert isinstance(future_write, asyncio.Future)
+        yield future_write
+
+        future_read = mqtt_client.read_property(td, prop_name)
+        assert isinstance(future_read, asyncio.Future)
+        yield future_read
+
+        future_shutdown = mqtt_client.shutdown()
+        assert isinstance(future_shutdown, asyncio.Future)
+        yield future_shutdown
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_invoke_action_concurrent(mqtt_servient):
+    """Concurrent Action invocations on the same MQTT client receive their own results."""
+
+    exposed_thing = next(mqtt_servient.exposed_things)
+    action_name = next(six.iterkeys(exposed_thing.actions))
+    td = ThingDescription.from_thing(exposed_thing.thing)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        mqtt_client = MQTTClient()
+
+        input_values = [Faker().pyint() for _ in range(10)]
+
+        results = yield [
+            mqtt_client.invoke_action(td, action_name, input_value, timeout=DEFAULT_TIMEOUT_SECS)
+            for input_value in input_values
+        ]
+
+        assert results == [input_value * 2 for input_value in input_values]
+        assert not len(mqtt_client._inflight)
+
+        yield mqtt_client.shutdown()
+
     run_test_coroutine(test_coroutine)
@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import gc
+import uuid
+
 import six
 import tornado.gen
 import tornado.ioloop
@@ -8,8 +11,11 @@ from faker import Faker
 
 from tests.utils import run_test_coroutine
 from wotpy.protocols.http.client import HTTPClient
+from wotpy.protocols.enums import InteractionVerbs
+from wotpy.protocols.utils import FormHrefCache, is_op_form
 from wotpy.protocols.ws.client import WebsocketClient
 from wotpy.support import is_coap_supported, is_mqtt_supported
+from wotpy.wot.dictionaries.link import FormDict
 from wotpy.wot.td import ThingDescription
 
 
@@ -68,3 +74,55 @@ def test_all_protocols_combined(all_protocols_servient):
             yield write_property(client)
 
     run_test_coroutine(test_coroutine)
+
+
+def test_form_href_cache():
+    """Form hrefs are picked once per TD and key and discarded along with the TD."""
+
+    td = ThingDescription({
+        "id": uuid.uuid4().urn,
+        "title": Faker().pystr(),
+        "security": [{"scheme": "nosec"}]
+    })
+
+    href_cache = FormHrefCache()
+    picks = []
+
+    def pick_href():
+        picks.append(True)
+        return Faker().url()
+
+    href = href_cache.get(td, ("prop", None), pick_href)
+
+    assert href_cache.get(td, ("prop", None), pick_href) == href
+    assert len(picks) == 1
+
+    href_cache.get(td, ("prop", "readproperty"), pick_href)
+
+    assert len(picks) == 2
+
+    del td
+    gc.collect()
+
+    assert not len(href_cache._cache)
+
+
+def test_is_op_form():
+    """Forms are matched against operations defined as single values or collections."""
+
+    href = Faker().url()
+    read = InteractionVerbs.READ_PROPERTY
+    write = InteractionVerbs.WRITE_PROPERTY
+
+    form_single = FormDict(href=href, op=read)
+    form_list = FormDict(href=href, op=[read, write])
+    form_none = FormDict(href=href)
+
+    assert is_op_form(form_single, None)
+    assert is_op_form(form_single, read)
+    assert not is_op_form(form_single, write)
+    assert not is_op_form(form_single, read[:4])
+    assert is_op_form(form_list, write)
+    assert not is_op_form(form_list, InteractionVerbs.INVOKE_ACTION)
+    assert is_op_form(form_none, None)
+    assert not is_op_form(form_none, read)
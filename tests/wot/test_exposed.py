@@ -22,15 +22,28 @@ from wotpy.wot.exposed.thing import ExposedThing
 from wotpy.wot.servient import Servient
 from wotpy.wot.thing import Thing
 
+_fake = Faker()
+
+
+@pytest.fixture(scope="module")
+def thread_executor():
+    """Thread pool executor shared by all the tests in this module."""
+
+    executor = ThreadPoolExecutor(max_workers=2)
+
+    yield executor
+
+    executor.shutdown(wait=True)
+
 
 def _test_td_change_events(exposed_thing, property_fragment, event_fragment, action_fragment, subscribe_func):
     """Helper function to test subscriptions to TD changes."""
 
     @tornado.gen.coroutine
     def test_coroutine():
-        prop_name = Faker().pystr()
-        event_name = Faker().pystr()
-        action_name = Faker().pystr()
+        prop_name = _fake.pystr()
+        event_name = _fake.pystr()
+        action_name = _fake.pystr()
 
         complete_futures = {
             (TDChangeType.PROPERTY, TDChangeMethod.ADD): Future(),
@@ -92,8 +105,8 @@ def test_read_property(exposed_thing, property_fragment):
 
     @tornado.gen.coroutine
     def test_coroutine():
-        prop_name = Faker().pystr()
-        prop_init_value = Faker().sentence()
+        prop_name = _fake.pystr()
+        prop_init_value = _fake.sentence()
         exposed_thing.add_property(prop_name, property_fragment, value=prop_init_value)
         value = yield exposed_thing.read_property(prop_name)
         assert value == prop_init_value
@@ -108,8 +121,8 @@ def test_write_property(exposed_thing, property_fragment):
 
     @tornado.gen.coroutine
     def test_coroutine():
-        updated_val = Faker().pystr()
-        prop_name = Faker().pystr()
+        updated_val = _fake.pystr()
+        prop_name = _fake.pystr()
 
         exposed_thing.add_property(prop_name, property_fragment)
 
@@ -132,20 +145,18 @@ def test_write_non_writable_property(exposed_thing):
 
     @tornado.gen.coroutine
     def test_coroutine():
-        prop_name = Faker().pystr()
+        prop_name = _fake.pystr()
         exposed_thing.add_property(prop_name, prop_init_non_writable)
 
         with pytest.raises(Exception):
-            yield exposed_thing.write_property(prop_name, Faker().pystr())
+            yield exposed_thing.write_property(prop_name, _fake.pystr())
 
     run_test_coroutine(test_coroutine)
 
 
-def test_invoke_action(exposed_thing, action_fragment):
+def test_invoke_action(exposed_thing, action_fragment, thread_executor):
     """Actions can be invoked on ExposedThings."""
 
-    thread_executor = ThreadPoolExecutor(max_workers=1)
-
     def upper_thread(parameters):
         input_value = parameters.get("input")
         return thread_executor.submit(lambda x: time.sleep(0.1) or str(x).upper(), input_value)
@@ -153,7 +164,7 @@ def test_invoke_action(exposed_thing, action_fragment):
     def upper(parameters):
         loop = tornado.ioloop.IOLoop.current()
         input_value = parameters.get("input")
-        return loop.run_in_executor(None, lambda x: time.sleep(0.1) or str(x).upper(), input_value)
+        return loop.run_in_executor(thread_executor, lambda x: time.sleep(0.1) or str(x).upper(), input_value)
 
     @tornado.gen.coroutine
     def lower(parameters):
@@ -167,21 +178,21 @@ def test_invoke_action(exposed_thing, action_fragment):
         future.set_result(input_value.title())
         return future
 
-    handlers_map = {
-        upper_thread: lambda x: x.upper(),
-        upper: lambda x: x.upper(),
-        lower: lambda x: x.lower(),
-        title: lambda x: x.title()
-    }
+    handler_cases = [
+        (upper_thread, lambda x: x.upper()),
+        (upper, lambda x: x.upper()),
+        (lower, lambda x: x.lower()),
+        (title, lambda x: x.title())
+    ]
 
     @tornado.gen.coroutine
     def test_coroutine():
-        action_name = Faker().pystr()
+        action_name = _fake.pystr()
         exposed_thing.add_action(action_name, action_fragment)
 
-        for handler, assert_func in six.iteritems(handlers_map):
+        for handler, assert_func in handler_cases:
             exposed_thing.set_action_handler(action_name, handler)
-            action_arg = Faker().sentence(10)
+            action_arg = _fake.sentence(10)
             result = yield exposed_thing.invoke_action(action_name, action_arg)
             assert result == assert_func(action_arg)
 
@@ -193,7 +204,7 @@ def test_invoke_action_undefined_handler(exposed_thing, action_fragment):
 
     @tornado.gen.coroutine
     def test_coroutine():
-        action_name = Faker().pystr()
+        action_name = _fake.pystr()
         exposed_thing.add_action(action_name, action_fragment)
 
         with pytest.raises(NotImplementedError):
@@ -220,12 +231,12 @@ def test_on_property_change(exposed_thing, property_fragment):
 
     @tornado.gen.coroutine
     def test_coroutine():
-        prop_name = Faker().pystr()
+        prop_name = _fake.pystr()
         exposed_thing.add_property(prop_name, property_fragment)
 
         observable_prop = exposed_thing.on_property_change(prop_name)
 
-        property_values = Faker().pylist(5, True, *(str,))
+        property_values = _fake.pylist(5, True, *(str,))
 
         emitted_values = []
 
@@ -234,8 +245,10 @@ def test_on_property_change(exposed_thing, property_fragment):
 
         subscription = observable_prop.subscribe(on_next_property_event)
 
-        for val in property_values:
-            yield exposed_thing.write_property(prop_name, val)
+        yield tornado.gen.multi([
+            exposed_thing.write_property(prop_name, val)
+            for val in property_values
+        ])
 
         assert emitted_values == property_values
 
@@ -254,7 +267,7 @@ def test_on_property_change_non_observable(exposed_thing):
 
     @tornado.gen.coroutine
     def test_coroutine():
-        prop_name = Faker().pystr()
+        prop_name = _fake.pystr()
         exposed_thing.add_property(prop_name, prop_init_non_observable)
 
         observable_prop = exposed_thing.on_property_change(prop_name)
@@ -270,7 +283,7 @@ def test_on_property_change_non_observable(exposed_thing):
 
         subscription = observable_prop.subscribe(on_next=on_next, on_error=on_error)
 
-        yield exposed_thing.write_property(prop_name, Faker().pystr())
+        yield exposed_thing.write_property(prop_name, _fake.pystr())
 
         with pytest.raises(Exception):
             future_error.result()
@@ -285,12 +298,12 @@ def test_on_property_change_non_observable(exposed_thing):
 def test_on_event(exposed_thing, event_fragment):
     """Events defined in the Thing Description can be observed."""
 
-    event_name = Faker().pystr()
+    event_name = _fake.pystr()
     exposed_thing.add_event(event_name, event_fragment)
 
     observable_event = exposed_thing.on_event(event_name)
 
-    event_payloads = [Faker().pystr() for _ in range(5)]
+    event_payloads = [_fake.pystr() for _ in range(5)]
 
     emitted_payloads = []
 
@@ -321,8 +334,8 @@ def test_thing_property_get(exposed_thing, property_fragment):
 
     @tornado.gen.coroutine
     def test_coroutine():
-        prop_name = Faker().pystr()
-        prop_init_value = Faker().sentence()
+        prop_name = _fake.pystr()
+        prop_init_value = _fake.sentence()
         exposed_thing.add_property(prop_name, property_fragment, value=prop_init_value)
         value = yield exposed_thing.properties[prop_name].read()
         assert value == prop_init_value
@@ -337,8 +350,8 @@ def test_thing_property_set(exposed_thing, property_fragment):
 
     @tornado.gen.coroutine
     def test_coroutine():
-        updated_val = Faker().pystr()
-        prop_name = Faker().pystr()
+        updated_val = _fake.pystr()
+        prop_name = _fake.pystr()
         exposed_thing.add_property(prop_name, property_fragment)
         yield exposed_thing.properties[prop_name].write(updated_val)
         value = yield exposed_thing.properties[prop_name].read()
@@ -354,10 +367,10 @@ def test_thing_property_subscribe(exposed_thing, property_fragment):
 
     @tornado.gen.coroutine
     def test_coroutine():
-        prop_name = Faker().pystr()
+        prop_name = _fake.pystr()
         exposed_thing.add_property(prop_name, property_fragment)
 
-        values = [Faker().sentence() for _ in range(10)]
+        values = [_fake.sentence() for _ in range(10)]
         values_futures = {key: Future() for key in values}
 
         def on_next(ev):
@@ -369,8 +382,10 @@ def test_thing_property_subscribe(exposed_thing, property_fragment):
 
         yield tornado.gen.sleep(0)
 
-        for val in values:
-            yield exposed_thing.properties[prop_name].write(val)
+        yield tornado.gen.multi([
+            exposed_thing.properties[prop_name].write(val)
+            for val in values
+        ])
 
         yield [future for future in six.itervalues(values_futures)]
 
@@ -385,8 +400,8 @@ def test_thing_property_getters(exposed_thing, property_fragment):
 
     @tornado.gen.coroutine
     def test_coroutine():
-        prop_name = Faker().pystr()
-        prop_init_value = Faker().sentence()
+        prop_name = _fake.pystr()
+        prop_init_value = _fake.sentence()
         exposed_thing.add_property(prop_name, property_fragment, value=prop_init_value)
         thing_property = exposed_thing.properties[prop_name]
 
@@ -409,9 +424,9 @@ def test_thing_action_run(exposed_thing, action_fragment):
 
     @tornado.gen.coroutine
     def test_coroutine():
-        action_name = Faker().pystr()
+        action_name = _fake.pystr()
         exposed_thing.add_action(action_name, action_fragment, lower)
-        input_value = Faker().pystr()
+        input_value = _fake.pystr()
 
         result = yield exposed_thing.actions[action_name].invoke(input_value)
         result_expected = yield exposed_thing.invoke_action(action_name, input_value)
@@ -427,7 +442,7 @@ def test_thing_action_getters(exposed_thing, action_fragment):
 
     @tornado.gen.coroutine
     def test_coroutine():
-        action_name = Faker().pystr()
+        action_name = _fake.pystr()
         exposed_thing.add_action(action_name, action_fragment)
         thing_action = exposed_thing.actions[action_name]
 
@@ -445,10 +460,10 @@ def test_thing_event_subscribe(exposed_thing, event_fragment):
 
     @tornado.gen.coroutine
     def test_coroutine():
-        event_name = Faker().pystr()
+        event_name = _fake.pystr()
         exposed_thing.add_event(event_name, event_fragment)
 
-        values = [Faker().sentence() for _ in range(10)]
+        values = [_fake.sentence() for _ in range(10)]
         values_futures = {key: Future() for key in values}
 
         def on_next(ev):
@@ -476,7 +491,7 @@ def test_thing_event_getters(exposed_thing, event_fragment):
 
     @tornado.gen.coroutine
     def test_coroutine():
-        event_name = Faker().pystr()
+        event_name = _fake.pystr()
         exposed_thing.add_event(event_name, event_fragment)
         thing_event = exposed_thing.events[event_name]
 
@@ -491,7 +506,7 @@ def test_thing_event_getters(exposed_thing, event_fragment):
 def test_set_property_read_handler(exposed_thing, property_fragment):
     """Read handlers can be defined for ExposedThing property interactions."""
 
-    const_prop_value = Faker().sentence()
+    const_prop_value = _fake.sentence()
 
     @tornado.gen.coroutine
     def read_handler():
@@ -499,7 +514,7 @@ def test_set_property_read_handler(exposed_thing, property_fragment):
 
     @tornado.gen.coroutine
     def test_coroutine():
-        prop_name = Faker().pystr()
+        prop_name = _fake.pystr()
         exposed_thing.add_property(prop_name, property_fragment)
         exposed_thing.set_property_read_handler(prop_name, read_handler)
         value = yield exposed_thing.properties[prop_name].read()
@@ -520,10 +535,10 @@ def test_set_property_write_handler(exposed_thing, property_fragment):
 
     @tornado.gen.coroutine
     def test_coroutine():
-        prop_name = Faker().pystr()
+        prop_name = _fake.pystr()
         exposed_thing.add_property(prop_name, property_fragment)
         exposed_thing.set_property_write_handler(prop_name, write_handler)
-        prop_value = Faker().sentence()
+        prop_value = _fake.sentence()
         assert not len(prop_history)
         yield exposed_thing.properties[prop_name].write(prop_value)
         assert prop_value in prop_history
@@ -543,7 +558,7 @@ def test_subscribe(exposed_thing, property_fragment, event_fragment, action_frag
 def test_thing_interaction_dict_behaviour(exposed_thing, property_fragment):
     """The Interactions dict-like interface of an ExposedThing behaves like a dict."""
 
-    prop_name = Faker().pystr()
+    prop_name = _fake.pystr()
     exposed_thing.add_property(prop_name, property_fragment)
 
     assert len(exposed_thing.properties) == 1
@@ -556,11 +571,11 @@ def test_thing_fragment_getters_setters():
 
     thing_fragment = ThingFragment({
         "id": uuid.uuid4().urn,
-        "title": Faker().pystr(),
-        "description": Faker().pystr(),
+        "title": _fake.pystr(),
+        "description": _fake.pystr(),
         "properties": {
             uuid.uuid4().hex: {
-                "description": Faker().pystr(),
+                "description": _fake.pystr(),
                 "type": DataType.STRING
             }
         }
@@ -574,10 +589,10 @@ def test_thing_fragment_getters_setters():
     assert list(exp_thing.properties) == list(six.iterkeys(thing_fragment.properties))
 
     title_original = thing_fragment.title
-    title_updated = Faker().pystr()
+    title_updated = _fake.pystr()
 
     description_original = thing_fragment.description
-    description_updated = Faker().pystr()
+    description_updated = _fake.pystr()
 
     exp_thing.title = title_updated
     exp_thing.description = description_updated
@@ -589,19 +604,19 @@ def test_thing_fragment_getters_setters():
 
     with pytest.raises(AttributeError):
         # noinspection PyPropertyAccess
-        exp_thing.id = Faker().pystr()
+        exp_thing.id = _fake.pystr()
 
     with pytest.raises(AttributeError):
         # noinspection PyPropertyAccess
-        exp_thing.properties = Faker().pylist()
+        exp_thing.properties = _fake.pylist()
 
     with pytest.raises(AttributeError):
         # noinspection PyPropertyAccess
-        exp_thing.actions = Faker().pylist()
+        exp_thing.actions = _fake.pylist()
 
     with pytest.raises(AttributeError):
         # noinspection PyPropertyAccess
-        exp_thing.events = Faker().pylist()
+        exp_thing.events = _fake.pylist()
 
 
 def _test_equivalent_interaction_names(base_name, transform_name):
@@ -614,7 +629,7 @@ def _test_equivalent_interaction_names(base_name, transform_name):
     prop_name = "property" + base_name
     prop_name_transform = transform_name(prop_name)
 
-    prop_default_value = Faker().pybool()
+    prop_default_value = _fake.pybool()
     exp_thing.add_property(prop_name, {"type": DataType.BOOLEAN}, value=prop_default_value)
 
     with pytest.raises(ValueError):
@@ -271,3 +271,28 @@ def test_clients_config():
     servient = Servient(clients_config={Protocols.HTTP: {"connect_timeout": connect_timeout}})
 
     assert servient.clients[Protocols.HTTP].connect_timeout == connect_timeout
+
+
+def test_clients_shutdown():
+    """The protocol clients are shut down along with the Servient."""
+
+    class ShutdownTrackingClient(WebsocketClient):
+        def __init__(self):
+            super(ShutdownTrackingClient, self).__init__()
+            self.shutdown_calls = 0
+
+        @tornado.gen.coroutine
+        def shutdown(self):
+            self.shutdown_calls += 1
+
+    ws_client = ShutdownTrackingClient()
+    servient = Servient(catalogue_port=None, clients=[ws_client])
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        yield servient.start()
+        assert ws_client.shutdown_calls == 0
+        yield servient.shutdown()
+        assert ws_client.shutdown_calls == 1
+
+    run_test_coroutine(test_coroutine)
@@ -30,6 +30,7 @@ def test_validate_err():
         lambda x: x.update({"actions": "hello-interactions"}) or x,
         lambda x: x.update({"events": {"overheating": {"forms": 0.5}}}) or x,
         lambda x: x.update({"events": {"Invalid Name": {}}}) or x,
+        lambda x: x.update({"properties": {"invalid/name": {"type": "string", "forms": []}}}) or x,
         lambda x: x.update({"events": {100: {"label": "Invalid Name"}}}) or x
     ]
 
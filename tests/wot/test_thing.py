@@ -33,6 +33,22 @@ def test_unique_url_name():
     assert len(url_names) == len(set(url_names))
 
 
+def test_url_name_follows_title():
+    """The memoized URL name of a Thing is updated when the title changes."""
+
+    thing = Thing(id=uuid.uuid4().urn, title="First title")
+    url_name = thing.url_name
+
+    assert thing.url_name == url_name
+    assert thing.uuid in url_name
+
+    thing.title = "Second title"
+
+    assert thing.url_name != url_name
+    assert thing.url_name.startswith("second-title")
+    assert thing.uuid in thing.url_name
+
+
 def test_empty_thing_valid():
     """An empty Thing initialized by default has a valid JSON-LD serialization."""
 
@@ -98,6 +114,7 @@ def test_remove_interaction():
     thing.add_interaction(interaction_02)
     thing.add_interaction(interaction_03)
 
+    assert thing.interactions_count == 3
     assert thing.find_interaction(interaction_01.name) is not None
     assert thing.find_interaction(interaction_02.name) is not None
     assert thing.find_interaction(interaction_03.name) is not None
@@ -108,6 +125,9 @@ def test_remove_interaction():
     assert thing.find_interaction(interaction_01.name) is None
     assert thing.find_interaction(interaction_02.name) is not None
     assert thing.find_interaction(interaction_03.name) is None
+    assert thing.find_interaction(slugify(interaction_01.name)) is None
+    assert thing.find_interaction(slugify(interaction_03.name)) is None
+    assert thing.interactions_count == 1
 
 
 def test_duplicated_interactions():
@@ -126,6 +146,21 @@ def test_duplicated_interactions():
         thing.add_interaction(interaction_03)
 
 
+def test_invalid_interactions():
+    """Objects that are not Interactions or belong to another Thing are rejected on a Thing."""
+
+    thing = Thing(id=uuid.uuid4().urn)
+    other_thing = Thing(id=uuid.uuid4().urn)
+
+    with pytest.raises(TypeError):
+        thing.add_interaction(object())
+
+    with pytest.raises(ValueError):
+        thing.add_interaction(Action(thing=other_thing, name="my_interaction"))
+
+    assert thing.interactions_count == 0
+
+
 def test_duplicated_forms():
     """Duplicated Forms are rejected on an Interaction."""
 
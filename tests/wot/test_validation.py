@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import copy
+import re
+import subprocess
+import sys
+
+import jsonschema
+import pytest
+
+from tests.td_examples import TD_EXAMPLE
+from wotpy.wot.validation import \
+    validate_thing, \
+    schema_fingerprint, \
+    is_valid_uri, \
+    _RE_ANY_URI, \
+    SCHEMA_DATA_SCHEMA, \
+    SCHEMA_SECURITY_SCHEME, \
+    SCHEMA_LINK, \
+    SCHEMA_FORM, \
+    SCHEMA_INTERACTION_PATTERN, \
+    SCHEMA_PROPERTY, \
+    SCHEMA_EVENT, \
+    SCHEMA_ACTION, \
+    SCHEMA_VERSIONING, \
+    SCHEMA_THING
+
+
+def test_validate_thing_safe_names():
+    """Interaction names are checked against REGEX_SAFE_NAME with the same results
+    as the stock validator, except for the trailing newline that $ does not match in ECMA-262."""
+
+    td_doc = copy.deepcopy(TD_EXAMPLE)
+    prop = next(iter(td_doc["properties"].values()))
+
+    td_doc["properties"]["valid_name-01"] = prop
+    validate_thing(td_doc)
+    jsonschema.validate(td_doc, SCHEMA_THING)
+
+    td_invalid = copy.deepcopy(td_doc)
+    td_invalid["properties"]["invalid name"] = prop
+
+    with pytest.raises(jsonschema.ValidationError) as exc_info:
+        validate_thing(td_invalid)
+
+    with pytest.raises(jsonschema.ValidationError) as exc_info_stock:
+        jsonschema.validate(td_invalid, SCHEMA_THING)
+
+    assert exc_info.value.message == exc_info_stock.value.message
+
+    td_newline = copy.deepcopy(td_doc)
+    td_newline["properties"]["name\n"] = prop
+
+    with pytest.raises(jsonschema.ValidationError):
+        validate_thing(td_newline)
+
+
+def test_validate_thing_same_types():
+    """The module validator accepts the same JSON types as jsonschema.validate with SCHEMA_THING."""
+
+    td_doc = copy.deepcopy(TD_EXAMPLE)
+    td_doc["security"] = tuple(td_doc["security"])
+
+    with pytest.raises(jsonschema.ValidationError):
+        jsonschema.validate(td_doc, SCHEMA_THING)
+
+    with pytest.raises(jsonschema.ValidationError):
+        validate_thing(td_doc)
+
+
+def test_schema_fingerprint():
+    """Each schema constant has a distinct fingerprint that is stable across processes."""
+
+    schemas = [
+        SCHEMA_DATA_SCHEMA,
+        SCHEMA_SECURITY_SCHEME,
+        SCHEMA_LINK,
+        SCHEMA_FORM,
+        SCHEMA_INTERACTION_PATTERN,
+        SCHEMA_PROPERTY,
+        SCHEMA_EVENT,
+        SCHEMA_ACTION,
+        SCHEMA_VERSIONING,
+        SCHEMA_THING
+    ]
+
+    fingerprints = [schema_fingerprint(schema) for schema in schemas]
+
+    for fingerprint in fingerprints:
+        assert re.match(r"^[0-9a-f]{64}$", fingerprint)
+
+    assert len(set(fingerprints)) == len(schemas)
+
+    script = (
+        "from wotpy.wot import validation; "
+        "print(validation.schema_fingerprint(validation.SCHEMA_THING))")
+
+    output = subprocess.check_output([sys.executable, "-c", script])
+
+    assert output.decode("utf-8").strip() == schema_fingerprint(SCHEMA_THING)
+
+    assert schema_fingerprint(copy.deepcopy(SCHEMA_THING)) is None
+    assert schema_fingerprint({"type": "object"}) is None
+
+
+def test_is_valid_uri_fast_path():
+    """The common scheme fast path of is_valid_uri gives the same results as the URI regex."""
+
+    prefixes = ["http://", "https://", "coap://", "coaps://", "mqtt://", "ws://", "wss://", "file://"]
+
+    uris = []
+
+    for prefix in prefixes:
+        uris += [
+            prefix,
+            prefix + u"localhost",
+            prefix + u"localhost:8080/path?query=1#fragment",
+            prefix + u"local host",
+            prefix + u"localhost\t",
+            prefix + u"localhost\n",
+            prefix + u"local\u00a0host",
+            prefix + u"local\u2003host",
+            prefix + u"localhost\u3000"
+        ]
+
+    uris += [
+        u"../",
+        u"../resource",
+        u"../../resource/path",
+        u"../resource with spaces",
+        u"../resource\u00a0nbsp",
+        u"http:",
+        u"urn:",
+        u"mailto:",
+        u"urn:example:resource",
+        u"resource",
+        u""
+    ]
+
+    for uri in uris:
+        assert is_valid_uri(uri) == (_RE_ANY_URI.match(uri) is not None), uri
@@ -5,8 +5,23 @@
 Class that represents the abstract client interface.
 """
 
+import functools
 from abc import ABCMeta, abstractmethod
 
+import tornado.gen
+
+
+def returns_future(func):
+    """Decorator for client methods implemented as native coroutines.
+    Schedules the coroutine built by the decorated method and returns a Future
+    for its result, as required by the BaseProtocolClient interface."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return tornado.gen.convert_yielded(func(*args, **kwargs))
+
+    return wrapper
+
 
 class BaseProtocolClient(object):
     """Base protocol client class.
@@ -70,3 +85,10 @@ class BaseProtocolClient(object):
         Returns an Observable."""
 
         raise NotImplementedError()
+
+    @tornado.gen.coroutine
+    def shutdown(self):
+        """Releases the resources (e.g. connections) kept open by this client.
+        The client may still be used afterwards. Returns a Future."""
+
+        pass
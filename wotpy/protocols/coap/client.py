@@ -6,52 +6,73 @@ Classes that contain the client logic for the CoAP protocol.
 """
 
 import asyncio
-import json
+import collections
 import logging
 import time
 
 import aiocoap
 import tornado.concurrent
-import tornado.gen
 import tornado.ioloop
 import tornado.locks
 from rx import Observable
 from six.moves.urllib_parse import urlparse
 
-from wotpy.protocols.client import BaseProtocolClient
-from wotpy.protocols.coap.enums import CoAPSchemes
+from wotpy.protocols.client import BaseProtocolClient, returns_future
+from wotpy.protocols.coap.enums import CoAPSchemes, CoAPBackpressure
 from wotpy.protocols.enums import Protocols, InteractionVerbs
 from wotpy.protocols.exceptions import FormNotFoundException, ProtocolClientException, ClientRequestTimeout
-from wotpy.protocols.utils import is_scheme_form
-from wotpy.utils.utils import handle_observer_finalization
+from wotpy.protocols.utils import is_scheme_form, is_op_form, FormHrefCache
+from wotpy.utils.serialization import json_dumps_wrapped, json_loads_fields
 from wotpy.wot.events import PropertyChangeEventInit, PropertyChangeEmittedEvent, EmittedEvent
 
+_COAP_SCHEMES = frozenset(CoAPSchemes.list())
+
 
 # noinspection PyCompatibility
 class CoAPClient(BaseProtocolClient):
     """Implementation of the protocol client interface for the CoAP protocol."""
 
-    def __init__(self):
+    DEFAULT_MAX_BUFFER = 1024
+
+    _INVOCATION_STATUS_KEYS = ("done", "error", "result")
+
+    def __init__(self, backpressure=CoAPBackpressure.BUFFER, max_buffer=DEFAULT_MAX_BUFFER):
+        if backpressure not in CoAPBackpressure.list():
+            raise ValueError("Unknown backpressure policy: {}".format(backpressure))
+
+        if max_buffer < 1:
+            raise ValueError("The maximum buffer size should be a positive integer")
+
+        self._backpressure = backpressure
+        self._max_buffer = max_buffer
         self._logr = logging.getLogger(__name__)
         self._coap_client = None
         self._client_lock = tornado.locks.Lock()
+        self._href_cache = FormHrefCache()
         super(CoAPClient, self).__init__()
 
+    async def _get_coap_client(self):
+        """Returns the aiocoap client context that is shared by all
+        requests of this client instance, creating it on first use."""
+
+        async with self._client_lock:
+            if self._coap_client is None:
+                self._logr.debug("Creating CoAP client context")
+                self._coap_client = await aiocoap.Context.create_client_context()
+
+            return self._coap_client
+
     @classmethod
     def _pick_coap_href(cls, td, forms, op=None):
         """Picks the most appropriate CoAP form href from the given list of forms."""
 
-        def is_op_form(form):
-            try:
-                return op is None or op == form.op or op in form.op
-            except TypeError:
-                return False
+        base = td.base
 
         def find_href(scheme):
             try:
                 return next(
                     form.href for form in forms
-                    if is_scheme_form(form, td.base, scheme) and is_op_form(form))
+                    if is_scheme_form(form, base, scheme) and is_op_form(form, op))
             except StopIteration:
                 return None
 
@@ -59,6 +80,14 @@ class CoAPClient(BaseProtocolClient):
 
         return form_coaps if form_coaps is not None else find_href(CoAPSchemes.COAP)
 
+    def _get_coap_href(self, td, get_forms, name, op=None):
+        """Returns the CoAP form href for the given interaction and operation.
+        The href is picked once and cached for the lifetime of the TD instance."""
+
+        return self._href_cache.get(
+            td, (get_forms.__name__, name, op),
+            lambda: self._pick_coap_href(td, get_forms(name), op=op))
+
     @classmethod
     def _assert_success(cls, res):
         """Asserts that the given CoAP response was successful and raises an Exception if not."""
@@ -68,7 +97,9 @@ class CoAPClient(BaseProtocolClient):
 
     def _build_subscribe(self, href, next_item_builder):
         """Builds the subscribe function that should be passed when
-        constructing an Observable linked to an observable CoAP resurce."""
+        constructing an Observable linked to an observable CoAP resurce.
+        Updates are delivered to the observer through a bounded queue that
+        either drops the oldest items or pauses the observation when full."""
 
         def subscribe(observer):
             """Subscription function to observe resources using the CoAP protocol."""
@@ -76,60 +107,88 @@ class CoAPClient(BaseProtocolClient):
             query = urlparse(href).query
 
             state = {
-                "active": True,
                 "request": None,
-                "pending": None
+                "task": None,
+                "draining": False
             }
 
-            @handle_observer_finalization(observer)
-            @tornado.gen.coroutine
-            def callback():
-                self._logr.debug("Creating CoAP client for observation: {}".format(query))
+            queue = collections.deque(maxlen=self._max_buffer)
+            queue_space = tornado.locks.Condition()
+
+            def drain():
+                state["draining"] = False
+
+                while queue:
+                    observer.on_next(queue.popleft())
+
+                queue_space.notify_all()
 
-                coap_client = yield aiocoap.Context.create_client_context()
+            async def push(item):
+                if item is None:
+                    return
 
+                if self._backpressure == CoAPBackpressure.BUFFER:
+                    while len(queue) >= self._max_buffer:
+                        await queue_space.wait()
+
+                queue.append(item)
+
+                if not state["draining"]:
+                    state["draining"] = True
+                    tornado.ioloop.IOLoop.current().add_callback(drain)
+
+            async def observe():
+                coap_client = await self._get_coap_client()
+
+                msg = aiocoap.Message(code=aiocoap.Code.GET, uri=href, observe=0)
+                request = coap_client.request(msg)
+                state["request"] = request
+
+                self._logr.debug("Sending observation request: {}".format(msg))
+
+                first_resp = await request.response
+                self._assert_success(first_resp)
+                await push(next_item_builder(first_resp.payload))
+
+                async for resp in request.observation:
+                    self._assert_success(resp)
+                    await push(next_item_builder(resp.payload))
+
+            async def callback():
                 try:
-                    msg = aiocoap.Message(code=aiocoap.Code.GET, uri=href, observe=0)
-                    state["request"] = coap_client.request(msg)
-
-                    self._logr.debug("Sending observation request: {}".format(msg))
-
-                    future_first_resp = state["request"].response
-                    state["pending"] = future_first_resp
-                    first_resp = yield future_first_resp
-                    state["pending"] = None
-                    self._assert_success(first_resp)
-                    next_item = next_item_builder(first_resp.payload)
-                    next_item is not None and observer.on_next(next_item)
-
-                    while state["active"]:
-                        next_obsv_gen = state["request"].observation.__aiter__().__anext__()
-                        future_resp = tornado.gen.convert_yielded(next_obsv_gen)
-                        state["pending"] = future_resp
-                        resp = yield future_resp
-                        state["pending"] = None
-                        self._assert_success(resp)
-                        next_item = next_item_builder(resp.payload)
-                        next_item is not None and observer.on_next(next_item)
-
-                    self._logr.debug("Terminated subscription callback for: {}".format(query))
+                    await observe()
+                    drain()
+                    observer.on_completed()
+                except asyncio.CancelledError:
+                    pass
+                except Exception as ex:
+                    drain()
+                    observer.on_error(ex)
                 finally:
-                    yield coap_client.shutdown()
+                    release_request()
+
+                self._logr.debug("Terminated subscription callback for: {}".format(query))
+
+            def release_request():
+                request = state["request"]
+                state["request"] = None
+
+                if request and not request.observation.cancelled:
+                    self._logr.debug("Cancelling observation on: {}".format(query))
+                    request.observation.cancel()
 
             def unsubscribe():
                 self._logr.debug("Unsubscribing from: {}".format(query))
 
-                state["active"] = False
+                # Cancelling the task also cancels the first response if it is still pending
 
-                if state["request"] and not state["request"].observation.cancelled:
-                    self._logr.debug("Cancelling observation on: {}".format(query))
-                    state["request"].observation.cancel()
+                if not state["task"].done():
+                    state["task"].cancel()
 
-                if state["pending"]:
-                    self._logr.debug("Cancelling pending request: {}".format(state["pending"]))
-                    state["pending"].cancel()
+                release_request()
+                queue.clear()
 
-            tornado.ioloop.IOLoop.current().add_callback(callback)
+            state["task"] = asyncio.get_event_loop().create_task(callback())
 
             return unsubscribe
 
@@ -147,10 +206,11 @@ class CoAPClient(BaseProtocolClient):
         with the given name is supported in this Protocol Binding client."""
 
         forms = td.get_forms(name)
+        base = td.base
 
         forms_coap = [
             form for form in forms
-            if is_scheme_form(form, td.base, CoAPSchemes.list())
+            if is_scheme_form(form, base, _COAP_SCHEMES)
         ]
 
         return len(forms_coap) > 0
@@ -158,7 +218,7 @@ class CoAPClient(BaseProtocolClient):
     async def _invocation_create(self, coap_client, href, input_value, timeout=None):
         """Creates a new action invocation by sending a POST request."""
 
-        payload = json.dumps({"input": input_value}).encode("utf-8")
+        payload = json_dumps_wrapped("input", input_value)
         msg = aiocoap.Message(code=aiocoap.Code.POST, payload=payload, uri=href)
         request = coap_client.request(msg)
 
@@ -169,14 +229,14 @@ class CoAPClient(BaseProtocolClient):
 
         self._assert_success(response)
 
-        invocation_id = json.loads(response.payload).get("id")
+        invocation_id = json_loads_fields(response.payload, ("id",)).get("id")
 
         return invocation_id
 
     async def _invocation_observe(self, coap_client, href, invocation_id, timeout=None):
         """Starts observing an existing action invocation by sending a GET request."""
 
-        payload = json.dumps({"id": invocation_id}).encode("utf-8")
+        payload = json_dumps_wrapped("id", invocation_id)
         msg = aiocoap.Message(code=aiocoap.Code.GET, payload=payload, uri=href, observe=0)
         request = coap_client.request(msg)
 
@@ -189,12 +249,13 @@ class CoAPClient(BaseProtocolClient):
 
         return request, response
 
-    async def _invocation_next(self, request, timeout=None):
-        """Waits for the next item in an active action invocation observation."""
+    async def _invocation_next(self, observation_iter, timeout=None):
+        """Waits for the next item in an active action invocation observation.
+        The same observation iterator should be reused across calls."""
 
         try:
             response = await asyncio.wait_for(
-                request.observation.__aiter__().__anext__(),
+                observation_iter.__anext__(),
                 timeout=timeout)
         except asyncio.TimeoutError:
             raise ClientRequestTimeout
@@ -206,23 +267,24 @@ class CoAPClient(BaseProtocolClient):
     async def invoke_action(self, td, name, input_value, timeout=None):
         """Invokes an Action on a remote Thing."""
 
-        href = self._pick_coap_href(
-            td, td.get_action_forms(name),
+        href = self._get_coap_href(
+            td, td.get_action_forms, name,
             op=InteractionVerbs.INVOKE_ACTION)
 
         if href is None:
             raise FormNotFoundException()
 
-        coap_client = await aiocoap.Context.create_client_context()
+        coap_client = await self._get_coap_client()
 
-        try:
-            invocation_id = await self._invocation_create(
-                coap_client, href, input_value, timeout=timeout)
+        invocation_id = await self._invocation_create(
+            coap_client, href, input_value, timeout=timeout)
 
-            request_obsv, response_obsv = await self._invocation_observe(
-                coap_client, href, invocation_id, timeout=timeout)
+        request_obsv, response_obsv = await self._invocation_observe(
+            coap_client, href, invocation_id, timeout=timeout)
 
-            invocation_status = json.loads(response_obsv.payload)
+        try:
+            observation_iter = request_obsv.observation.__aiter__()
+            invocation_status = json_loads_fields(response_obsv.payload, self._INVOCATION_STATUS_KEYS)
 
             now = time.time()
 
@@ -230,87 +292,79 @@ class CoAPClient(BaseProtocolClient):
                 if timeout and (time.time() - now) > timeout:
                     raise ClientRequestTimeout
 
-                response_obsv = await self._invocation_next(request_obsv, timeout=timeout)
-                invocation_status = json.loads(response_obsv.payload)
-
+                response_obsv = await self._invocation_next(observation_iter, timeout=timeout)
+                invocation_status = json_loads_fields(response_obsv.payload, self._INVOCATION_STATUS_KEYS)
+        finally:
             if not request_obsv.observation.cancelled:
                 request_obsv.observation.cancel()
 
-            if invocation_status.get("error"):
-                raise Exception(invocation_status.get("error"))
-            else:
-                return invocation_status.get("result")
-        finally:
-            await coap_client.shutdown()
+        if invocation_status.get("error"):
+            raise Exception(invocation_status.get("error"))
+        else:
+            return invocation_status.get("result")
 
     async def write_property(self, td, name, value, timeout=None):
         """Updates the value of a Property on a remote Thing."""
 
-        href = self._pick_coap_href(
-            td, td.get_property_forms(name),
+        href = self._get_coap_href(
+            td, td.get_property_forms, name,
             op=InteractionVerbs.WRITE_PROPERTY)
 
         if href is None:
             raise FormNotFoundException()
 
-        coap_client = await aiocoap.Context.create_client_context()
+        coap_client = await self._get_coap_client()
 
-        try:
-            payload = json.dumps({"value": value}).encode("utf-8")
-            msg = aiocoap.Message(code=aiocoap.Code.PUT, payload=payload, uri=href)
-            request = coap_client.request(msg)
+        payload = json_dumps_wrapped("value", value)
+        msg = aiocoap.Message(code=aiocoap.Code.PUT, payload=payload, uri=href)
+        request = coap_client.request(msg)
 
-            try:
-                response = await asyncio.wait_for(request.response, timeout=timeout)
-            except asyncio.TimeoutError:
-                raise ClientRequestTimeout
+        try:
+            response = await asyncio.wait_for(request.response, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise ClientRequestTimeout
 
-            self._assert_success(response)
-        finally:
-            await coap_client.shutdown()
+        self._assert_success(response)
 
     async def read_property(self, td, name, timeout=None):
         """Reads the value of a Property on a remote Thing."""
 
-        href = self._pick_coap_href(
-            td, td.get_property_forms(name),
+        href = self._get_coap_href(
+            td, td.get_property_forms, name,
             op=InteractionVerbs.READ_PROPERTY)
 
         if href is None:
             raise FormNotFoundException()
 
-        coap_client = await aiocoap.Context.create_client_context()
+        coap_client = await self._get_coap_client()
 
-        try:
-            msg = aiocoap.Message(code=aiocoap.Code.GET, uri=href)
-            request = coap_client.request(msg)
+        msg = aiocoap.Message(code=aiocoap.Code.GET, uri=href)
+        request = coap_client.request(msg)
 
-            try:
-                response = await asyncio.wait_for(request.response, timeout=timeout)
-            except asyncio.TimeoutError:
-                raise ClientRequestTimeout
+        try:
+            response = await asyncio.wait_for(request.response, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise ClientRequestTimeout
 
-            self._assert_success(response)
+        self._assert_success(response)
 
-            prop_value = json.loads(response.payload).get("value")
+        prop_value = json_loads_fields(response.payload, ("value",)).get("value")
 
-            return prop_value
-        finally:
-            await coap_client.shutdown()
+        return prop_value
 
     def on_property_change(self, td, name):
         """Subscribes to property changes on a remote Thing.
         Returns an Observable"""
 
-        href = self._pick_coap_href(
-            td, td.get_property_forms(name),
+        href = self._get_coap_href(
+            td, td.get_property_forms, name,
             op=InteractionVerbs.OBSERVE_PROPERTY)
 
         if href is None:
             raise FormNotFoundException()
 
         def next_item_builder(payload):
-            value = json.loads(payload).get("value")
+            value = json_loads_fields(payload, ("value",)).get("value")
             init = PropertyChangeEventInit(name=name, value=value)
             return PropertyChangeEmittedEvent(init=init)
 
@@ -323,8 +377,8 @@ class CoAPClient(BaseProtocolClient):
         """Subscribes to an event on a remote Thing.
         Returns an Observable."""
 
-        href = self._pick_coap_href(
-            td, td.get_event_forms(name),
+        href = self._get_coap_href(
+            td, td.get_event_forms, name,
             op=InteractionVerbs.SUBSCRIBE_EVENT)
 
         if href is None:
@@ -332,7 +386,7 @@ class CoAPClient(BaseProtocolClient):
 
         def next_item_builder(payload):
             if payload:
-                data = json.loads(payload).get("data")
+                data = json_loads_fields(payload, ("data",)).get("data")
                 return EmittedEvent(init=data, name=name)
             else:
                 return None
@@ -342,6 +396,22 @@ class CoAPClient(BaseProtocolClient):
         # noinspection PyUnresolvedReferences
         return Observable.create(subscribe)
 
+    @returns_future
+    async def shutdown(self):
+        """Shuts down the shared aiocoap client context.
+        Called by the Servient on shutdown. A new context
+        is created if the client is used afterwards.
+        Returns a Future."""
+
+        async with self._client_lock:
+            if self._coap_client is None:
+                return
+
+            self._logr.debug("Shutting down CoAP client context")
+
+            await self._coap_client.shutdown()
+            self._coap_client = None
+
     def on_td_change(self, url):
         """Subscribes to Thing Description changes on a remote Thing.
         Returns an Observable."""
@@ -13,3 +13,11 @@ class CoAPSchemes(EnumListMixin):
 
     COAP = "coap"
     COAPS = "coaps"
+
+
+class CoAPBackpressure(EnumListMixin):
+    """Enumeration of the policies applied when observation
+    updates arrive faster than subscribers consume them."""
+
+    DROP = "drop"
+    BUFFER = "buffer"
@@ -21,7 +21,7 @@ from wotpy.protocols.client import BaseProtocolClient
 from wotpy.protocols.enums import Protocols, InteractionVerbs
 from wotpy.protocols.exceptions import FormNotFoundException, ClientRequestTimeout
 from wotpy.protocols.http.enums import HTTPSchemes
-from wotpy.protocols.utils import is_scheme_form
+from wotpy.protocols.utils import is_scheme_form, is_op_form
 from wotpy.utils.utils import handle_observer_finalization
 from wotpy.wot.events import EmittedEvent, PropertyChangeEmittedEvent, PropertyChangeEventInit
 
@@ -43,17 +43,13 @@ class HTTPClient(BaseProtocolClient):
     def pick_http_href(cls, td, forms, op=None):
         """Picks the most appropriate HTTP form href from the given list of forms."""
 
-        def is_op_form(form):
-            try:
-                return op is None or op == form.op or op in form.op
-            except TypeError:
-                return False
+        base = td.base
 
         def find_href(scheme):
             try:
                 return next(
                     form.href for form in forms
-                    if is_scheme_form(form, td.base, scheme) and is_op_form(form))
+                    if is_scheme_form(form, base, scheme) and is_op_form(form, op))
             except StopIteration:
                 return None
 
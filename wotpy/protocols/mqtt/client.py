@@ -6,13 +6,15 @@ Classes that contain the client logic for the MQTT protocol.
 """
 
 import asyncio
+import collections
 import copy
 import datetime
-import json
+import functools
+import itertools
 import logging
+import os
 import pprint
 import time
-import uuid
 
 import hbmqtt.client
 import tornado.concurrent
@@ -23,7 +25,7 @@ from hbmqtt.mqtt.constants import QOS_0, QOS_1, QOS_2
 from rx import Observable
 from six.moves.urllib import parse
 
-from wotpy.protocols.client import BaseProtocolClient
+from wotpy.protocols.client import BaseProtocolClient, returns_future
 from wotpy.protocols.enums import InteractionVerbs, Protocols
 from wotpy.protocols.exceptions import (ClientRequestTimeout,
                                         FormNotFoundException)
@@ -31,11 +33,29 @@ from wotpy.protocols.mqtt.enums import MQTTSchemes
 from wotpy.protocols.mqtt.handlers.action import ActionMQTTHandler
 from wotpy.protocols.mqtt.handlers.property import PropertyMQTTHandler
 from wotpy.protocols.refs import ConnRefCounter
-from wotpy.protocols.utils import is_scheme_form
+from wotpy.protocols.utils import is_scheme_form, is_op_form, FormHrefCache
+from wotpy.utils.serialization import json_dumps, json_loads
 from wotpy.utils.utils import handle_observer_finalization
 from wotpy.wot.events import (EmittedEvent, PropertyChangeEmittedEvent,
                               PropertyChangeEventInit)
 
+_MQTT_SCHEMES = frozenset(MQTTSchemes.list())
+
+ParsedHref = collections.namedtuple("ParsedHref", ["broker_url", "topic"])
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_href(href):
+    """Takes an MQTT form href and returns
+    the MQTT broker URL and the topic separately."""
+
+    parsed_href = parse.urlparse(href)
+    assert parsed_href.scheme and parsed_href.netloc and parsed_href.path
+
+    return ParsedHref(
+        broker_url="{}://{}".format(parsed_href.scheme, parsed_href.netloc),
+        topic=parsed_href.path.lstrip("/").rstrip("/"))
+
 
 class MQTTClient(BaseProtocolClient):
     """Implementation of the protocol client interface for the MQTT protocol."""
@@ -56,6 +76,14 @@ class MQTTClient(BaseProtocolClient):
         "keep_alive": 90
     }
 
+    # Correlation IDs only need to be unique among the clients talking to the same broker.
+    # A random per-process prefix and a counter are enough and cheaper than calling uuid4.
+    # Both are regenerated when the PID changes so that forked processes do not share them.
+
+    _id_pid = None
+    _id_prefix = None
+    _id_counter = None
+
     def __init__(self,
                  deliver_timeout_secs=DEFAULT_DELIVER_TIMEOUT_SECS,
                  msg_wait_timeout_secs=DEFAULT_MSG_WAIT_TIMEOUT_SECS,
@@ -69,15 +97,31 @@ class MQTTClient(BaseProtocolClient):
         self._timeout_default = timeout_default
         self._hbmqtt_config = hbmqtt_config
         self._stop_loop_timeout_secs = stop_loop_timeout_secs
-        self._lock_client = tornado.locks.Lock()
+        self._locks_client = collections.defaultdict(tornado.locks.Lock)
         self._deliver_stop_events = {}
         self._msg_conditions = {}
         self._clients = {}
         self._messages = {}
         self._topics = {}
+        self._inflight = {}
+        self._href_cache = FormHrefCache()
         self._ref_counter = ConnRefCounter()
+        self._disconnect_pending = set()
         self._logr = logging.getLogger(__name__)
 
+    @classmethod
+    def _next_id(cls):
+        """Returns a new ID to correlate requests and responses and track references."""
+
+        pid = os.getpid()
+
+        if cls._id_pid != pid:
+            cls._id_pid = pid
+            cls._id_prefix = os.urandom(6).hex()
+            cls._id_counter = itertools.count()
+
+        return "{}-{}".format(cls._id_prefix, next(cls._id_counter))
+
     def _build_client_config(self):
         """Returns the config dict for a new hbmqtt client instance."""
 
@@ -98,6 +142,11 @@ class MQTTClient(BaseProtocolClient):
         assert broker_url in self._msg_conditions, "Unknown broker in conditions"
         assert msg.topic in self._msg_conditions[broker_url], "Unknown topic"
 
+        msg_data = json_loads(msg.data)
+
+        if self._resolve_inflight(broker_url, msg.topic, msg_data):
+            return
+
         if broker_url not in self._messages:
             self._messages[broker_url] = {}
 
@@ -105,23 +154,40 @@ class MQTTClient(BaseProtocolClient):
             self._messages[broker_url][msg.topic] = []
 
         self._messages[broker_url][msg.topic].append({
-            "id": uuid.uuid4().hex,
-            "data": json.loads(msg.data.decode()),
+            "id": self._next_id(),
+            "data": msg_data,
             "time": time.time()
         })
 
         self._msg_conditions[broker_url][msg.topic].notify_all()
         self._clean_messages(broker_url)
 
-    @tornado.gen.coroutine
-    def _reconnect_client(self, broker_url):
+    def _resolve_inflight(self, broker_url, topic, msg_data):
+        """Passes the message to the Future of the in-flight request that is
+        waiting for it (matched by its correlation ID) and returns True if any."""
+
+        if not isinstance(msg_data, dict):
+            return False
+
+        future_inflight = self._inflight.pop(
+            (broker_url, topic, msg_data.get("id")), None)
+
+        if future_inflight is None:
+            return False
+
+        if not future_inflight.done():
+            future_inflight.set_result(msg_data)
+
+        return True
+
+    async def _reconnect_client(self, broker_url):
         """Reconnects an existing client that has been disconnected."""
 
         assert broker_url in self._clients, "Unknown broker"
 
         self._logr.info("Reconnecting MQTT client: {}".format(broker_url))
 
-        yield self._clients[broker_url].reconnect(cleansession=False)
+        await self._clients[broker_url].reconnect(cleansession=False)
 
         topics = self._topics.get(broker_url, set())
 
@@ -131,26 +197,24 @@ class MQTTClient(BaseProtocolClient):
         self._logr.info("Resubscribing MQTT client on {} to topics:\n{}".format(
             broker_url, pprint.pformat(topics)))
 
-        yield self._clients[broker_url].subscribe([(topic, qos) for topic, qos in topics])
+        await self._clients[broker_url].subscribe([(topic, qos) for topic, qos in topics])
 
     def _build_deliver(self, broker_url, stop_event):
         """Factory for functions to get messages delivered by the broker into the messages queue."""
 
-        @tornado.gen.coroutine
-        def reconnect():
+        async def reconnect():
             """Sleeps for a while and tries to reconnect and resubscribe afterwards."""
 
             try:
                 self._logr.debug("Sleeping for {} s".format(
                     self.SLEEP_SECS_DELIVER_ERR))
-                yield tornado.gen.sleep(self.SLEEP_SECS_DELIVER_ERR)
-                yield self._reconnect_client(broker_url)
+                await tornado.gen.sleep(self.SLEEP_SECS_DELIVER_ERR)
+                await self._reconnect_client(broker_url)
             except Exception as ex_reconn:
                 self._logr.warning("Error reconnecting: {}".format(
                     ex_reconn), exc_info=True)
 
-        @tornado.gen.coroutine
-        def deliver():
+        async def deliver():
             """Loop that receives the messages from the broker."""
 
             assert broker_url in self._clients
@@ -160,14 +224,14 @@ class MQTTClient(BaseProtocolClient):
 
             while not stop_event.is_set():
                 try:
-                    msg = yield self._clients[broker_url].deliver_message(
+                    msg = await self._clients[broker_url].deliver_message(
                         timeout=self._deliver_timeout_secs)
                 except asyncio.TimeoutError:
                     continue
                 except Exception as ex:
                     self._logr.warning(
                         "Error delivering message: {}".format(ex))
-                    yield reconnect()
+                    await reconnect()
                     continue
 
                 try:
@@ -184,8 +248,7 @@ class MQTTClient(BaseProtocolClient):
 
         return deliver
 
-    @tornado.gen.coroutine
-    def _start_deliver_loop(self, broker_url):
+    async def _start_deliver_loop(self, broker_url):
         """Starts the message delivery loop in the background."""
 
         assert broker_url not in self._deliver_stop_events, "Stop event is already defined"
@@ -195,8 +258,7 @@ class MQTTClient(BaseProtocolClient):
         deliver_loop_cb = self._build_deliver(broker_url, stop_event)
         tornado.ioloop.IOLoop.current().add_callback(deliver_loop_cb)
 
-    @tornado.gen.coroutine
-    def _stop_deliver_loop(self, broker_url):
+    async def _stop_deliver_loop(self, broker_url):
         """Asks the message delivery loop to stop gracefully."""
 
         assert broker_url in self._deliver_stop_events, "Unknown broker"
@@ -220,15 +282,14 @@ class MQTTClient(BaseProtocolClient):
 
         while self._deliver_stop_events[broker_url].is_set():
             raise_timeout()
-            yield tornado.gen.sleep(self.DELIVER_TERMINATE_LOOP_SLEEP_SECS)
+            await tornado.gen.sleep(self.DELIVER_TERMINATE_LOOP_SLEEP_SECS)
 
         self._deliver_stop_events.pop(broker_url)
 
-    @tornado.gen.coroutine
-    def _init_client(self, broker_url, ref_id):
+    async def _init_client(self, broker_url, ref_id):
         """Initializes and connects a client to the given broker URL."""
 
-        with (yield self._lock_client.acquire()):
+        async with self._locks_client[broker_url]:
             self._ref_counter.increase(broker_url, ref_id)
 
             if broker_url in self._clients:
@@ -241,25 +302,48 @@ class MQTTClient(BaseProtocolClient):
 
             self._clients[broker_url] = hbmqtt.client.MQTTClient(config=config)
 
-            yield self._clients[broker_url].connect(broker_url, cleansession=False)
-
-            yield self._start_deliver_loop(broker_url)
-
-    @tornado.gen.coroutine
-    def _disconnect_client(self, broker_url, ref_id):
-        """Decreases the reference counter for the client on the given broker and cleans
-        all resources when the client does not have any more references pointing to it."""
-
-        with (yield self._lock_client.acquire()):
-            self._ref_counter.decrease(broker_url, ref_id)
+            try:
+                await self._clients[broker_url].connect(broker_url, cleansession=False)
+                await self._start_deliver_loop(broker_url)
+            except Exception:
+                self._clients.pop(broker_url, None)
+                self._ref_counter.decrease(broker_url, ref_id)
+                raise
+
+    async def _release_client(self, broker_url, ref_id):
+        """Decreases the reference counter for the client on the given broker.
+        The client is kept connected to be reused by subsequent requests,
+        unless a shutdown was requested while it was still in use."""
+
+        async with self._locks_client[broker_url]:
+            if self._ref_counter.has_ref(broker_url, ref_id):
+                self._ref_counter.decrease(broker_url, ref_id)
+
+        if broker_url in self._disconnect_pending:
+            await self._disconnect_client(broker_url)
+
+    async def _disconnect_client(self, broker_url):
+        """Stops the message delivery loop and disconnects the
+        client on the given broker, cleaning all related resources.
+        Clients that are still in use are disconnected when their last reference is released."""
+
+        async with self._locks_client[broker_url]:
+            if broker_url not in self._clients:
+                self._disconnect_pending.discard(broker_url)
+                return
 
             if self._ref_counter.has_any(broker_url):
+                self._logr.debug(
+                    "Deferring disconnection of MQTT client in use: {}".format(broker_url))
+                self._disconnect_pending.add(broker_url)
                 return
 
+            self._disconnect_pending.discard(broker_url)
+
             try:
                 self._logr.debug(
                     "Stopping message delivery loop: {}".format(broker_url))
-                yield self._stop_deliver_loop(broker_url)
+                await self._stop_deliver_loop(broker_url)
             except Exception as ex:
                 self._logr.warning(
                     "Error stopping deliver loop: {}".format(ex),
@@ -268,7 +352,7 @@ class MQTTClient(BaseProtocolClient):
             try:
                 self._logr.debug(
                     "Disconnecting MQTT client: {}".format(broker_url))
-                yield self._clients[broker_url].disconnect()
+                await self._clients[broker_url].disconnect()
             except Exception as ex:
                 self._logr.warning(
                     "Error disconnecting: {}".format(ex),
@@ -279,11 +363,10 @@ class MQTTClient(BaseProtocolClient):
             self._msg_conditions.pop(broker_url, None)
             self._topics.pop(broker_url, None)
 
-    @tornado.gen.coroutine
-    def _subscribe(self, broker_url, topic, qos):
+    async def _subscribe(self, broker_url, topic, qos):
         """Subscribes to a topic."""
 
-        with (yield self._lock_client.acquire()):
+        async with self._locks_client[broker_url]:
             if broker_url not in self._clients:
                 return
 
@@ -297,19 +380,21 @@ class MQTTClient(BaseProtocolClient):
             if broker_url not in self._topics:
                 self._topics[broker_url] = set()
 
+            if (topic, qos) in self._topics[broker_url]:
+                return
+
             self._topics[broker_url].add((topic, qos))
 
-            yield self._clients[broker_url].subscribe([(topic, qos)])
+            await self._clients[broker_url].subscribe([(topic, qos)])
 
-    @tornado.gen.coroutine
-    def _publish(self, broker_url, topic, payload, qos):
+    async def _publish(self, broker_url, topic, payload, qos):
         """Publishes a message with the given payload in a topic."""
 
-        with (yield self._lock_client.acquire()):
+        async with self._locks_client[broker_url]:
             if broker_url not in self._clients:
                 return
 
-            yield self._clients[broker_url].publish(topic, payload, qos=qos)
+            await self._clients[broker_url].publish(topic, payload, qos=qos)
 
     def _topic_messages(self, broker_url, topic, from_time=None, ignore_ids=None):
         """Returns a generator that yields the messages in the
@@ -348,8 +433,7 @@ class MQTTClient(BaseProtocolClient):
 
         return next((item for item in self._topic_messages(broker_url, topic) if func(item)), None)
 
-    @tornado.gen.coroutine
-    def _wait_on_message(self, broker_url, topic):
+    async def _wait_on_message(self, broker_url, topic):
         """Waits for the arrival of a message in the given topic."""
 
         assert broker_url in self._msg_conditions, "Unknown broker URL"
@@ -357,35 +441,26 @@ class MQTTClient(BaseProtocolClient):
 
         wait_timeout = datetime.timedelta(seconds=self._msg_wait_timeout_secs)
 
-        yield self._msg_conditions[broker_url][topic].wait(timeout=wait_timeout)
+        await self._msg_conditions[broker_url][topic].wait(timeout=wait_timeout)
 
     @classmethod
     def _pick_mqtt_href(cls, td, forms, op=None):
         """Picks the most appropriate MQTT form href from the given list of forms."""
 
-        def is_op_form(form):
-            try:
-                return op is None or op == form.op or op in form.op
-            except TypeError:
-                return False
+        base = td.base
 
         return next((
             form.href for form in forms
-            if is_scheme_form(form, td.base, MQTTSchemes.MQTT) and is_op_form(form)
+            if is_scheme_form(form, base, MQTTSchemes.MQTT) and is_op_form(form, op)
         ), None)
 
-    @classmethod
-    def _parse_href(cls, href):
-        """Takes an MQTT form href and returns
-        the MQTT broker URL and the topic separately."""
-
-        parsed_href = parse.urlparse(href)
-        assert parsed_href.scheme and parsed_href.netloc and parsed_href.path
+    def _get_mqtt_href(self, td, get_forms, name, op=None):
+        """Returns the MQTT form href for the given interaction and operation.
+        The href is picked once and cached for the lifetime of the TD instance."""
 
-        return {
-            "broker_url": "{}://{}".format(parsed_href.scheme, parsed_href.netloc),
-            "topic": parsed_href.path.lstrip("/").rstrip("/")
-        }
+        return self._href_cache.get(
+            td, (get_forms.__name__, name, op),
+            lambda: self._pick_mqtt_href(td, get_forms(name), op=op))
 
     @property
     def protocol(self):
@@ -399,112 +474,109 @@ class MQTTClient(BaseProtocolClient):
         with the given name is supported in this Protocol Binding client."""
 
         forms = td.get_forms(name)
+        base = td.base
 
         forms_mqtt = [
             form for form in forms
-            if is_scheme_form(form, td.base, MQTTSchemes.list())
+            if is_scheme_form(form, base, _MQTT_SCHEMES)
         ]
 
         return len(forms_mqtt) > 0
 
-    @tornado.gen.coroutine
-    def invoke_action(self, td, name, input_value, timeout=None,
-                      qos_publish=QOS_2, qos_subscribe=QOS_1):
+    @returns_future
+    async def invoke_action(self, td, name, input_value, timeout=None,
+                            qos_publish=QOS_2, qos_subscribe=QOS_1):
         """Invokes an Action on a remote Thing.
         Returns a Future."""
 
         timeout = timeout if timeout else self._timeout_default
-        ref_id = uuid.uuid4().hex
+        ref_id = self._next_id()
 
-        href = self._pick_mqtt_href(td, td.get_action_forms(name))
+        href = self._get_mqtt_href(td, td.get_action_forms, name)
 
         if href is None:
             raise FormNotFoundException()
 
-        parsed_href = self._parse_href(href)
-        broker_url = parsed_href["broker_url"]
+        parsed_href = _parse_href(href)
+        broker_url = parsed_href.broker_url
 
-        topic_invoke = parsed_href["topic"]
+        topic_invoke = parsed_href.topic
         topic_result = ActionMQTTHandler.to_result_topic(topic_invoke)
 
         try:
-            yield self._init_client(broker_url, ref_id)
-            yield self._subscribe(broker_url, topic_result, qos_subscribe)
+            await self._init_client(broker_url, ref_id)
+            await self._subscribe(broker_url, topic_result, qos_subscribe)
 
             input_data = {
-                "id": uuid.uuid4().hex,
+                "id": self._next_id(),
                 "input": input_value
             }
 
-            input_payload = json.dumps(input_data).encode()
+            input_payload = json_dumps(input_data)
 
-            yield self._publish(broker_url, topic_invoke, input_payload, qos_publish)
-
-            ini = time.time()
-
-            while True:
-                self._logr.debug(
-                    "Checking invocation topic: {}".format(topic_result))
-
-                if timeout and (time.time() - ini) > timeout:
-                    self._logr.warning(
-                        "Timeout invoking Action: {}".format(topic_result))
-                    raise ClientRequestTimeout
+            inflight_key = (broker_url, topic_result, input_data["id"])
+            future_result = tornado.concurrent.Future()
+            self._inflight[inflight_key] = future_result
 
-                msg_match = self._next_match(
-                    broker_url, topic_result,
-                    lambda item: item[1].get("id") == input_data.get("id"))
-
-                if not msg_match:
-                    yield self._wait_on_message(broker_url, topic_result)
-                    continue
-
-                msg_id, msg_data, msg_time = msg_match
+            try:
+                await self._publish(broker_url, topic_invoke, input_payload, qos_publish)
 
-                if msg_data.get("error", None) is not None:
-                    raise Exception(msg_data.get("error"))
+                if timeout:
+                    msg_data = await tornado.gen.with_timeout(
+                        datetime.timedelta(seconds=timeout), future_result)
                 else:
-                    raise tornado.gen.Return(msg_data.get("result"))
+                    msg_data = await future_result
+            except tornado.gen.TimeoutError:
+                self._logr.warning(
+                    "Timeout invoking Action: {}".format(topic_result))
+                raise ClientRequestTimeout
+            finally:
+                self._inflight.pop(inflight_key, None)
+
+            if msg_data.get("error", None) is not None:
+                raise Exception(msg_data.get("error"))
+            else:
+                return msg_data.get("result")
         finally:
-            yield self._disconnect_client(broker_url, ref_id)
+            await self._release_client(broker_url, ref_id)
 
-    @tornado.gen.coroutine
-    def write_property(self, td, name, value, timeout=None,
-                       qos_publish=QOS_2, qos_subscribe=QOS_1, wait_ack=True):
+    @returns_future
+    async def write_property(self, td, name, value, timeout=None,
+                             qos_publish=QOS_2, qos_subscribe=QOS_1, wait_ack=True):
         """Updates the value of a Property on a remote Thing.
         Due to the MQTT binding design this coroutine yields as soon as the write message has
         been published and will not wait for a custom write handler that yields to another coroutine
         Returns a Future."""
 
         timeout = timeout if timeout else self._timeout_default
-        ref_id = uuid.uuid4().hex
+        ref_id = self._next_id()
 
-        href_write = self._pick_mqtt_href(
-            td, td.get_property_forms(name),
+        href_write = self._get_mqtt_href(
+            td, td.get_property_forms, name,
             op=InteractionVerbs.WRITE_PROPERTY)
 
         if href_write is None:
             raise FormNotFoundException()
 
-        parsed_href_write = self._parse_href(href_write)
-        broker_url = parsed_href_write["broker_url"]
+        parsed_href_write = _parse_href(href_write)
+        broker_url = parsed_href_write.broker_url
 
-        topic_write = parsed_href_write["topic"]
+        topic_write = parsed_href_write.topic
         topic_ack = PropertyMQTTHandler.to_write_ack_topic(topic_write)
 
         try:
-            yield self._init_client(broker_url, ref_id)
-            yield self._subscribe(broker_url, topic_ack, qos_subscribe)
+            await self._init_client(broker_url, ref_id)
+            await self._subscribe(broker_url, topic_ack, qos_subscribe)
 
             write_data = {
                 "action": "write",
                 "value": value,
-                "ack": uuid.uuid4().hex
+                "ack": self._next_id()
             }
 
-            write_payload = json.dumps(write_data).encode()
+            write_payload = json_dumps(write_data)
 
-            yield self._publish(broker_url, topic_write, write_payload, qos_publish)
+            await self._publish(broker_url, topic_write, write_payload, qos_publish)
 
             if not wait_ack:
                 return
@@ -527,51 +599,51 @@ class MQTTClient(BaseProtocolClient):
                 if msg_match:
                     break
 
-                yield self._wait_on_message(broker_url, topic_ack)
+                await self._wait_on_message(broker_url, topic_ack)
         finally:
-            yield self._disconnect_client(broker_url, ref_id)
+            await self._release_client(broker_url, ref_id)
 
-    @tornado.gen.coroutine
-    def read_property(self, td, name, timeout=None,
-                      qos_publish=QOS_1, qos_subscribe=QOS_1):
+    @returns_future
+    async def read_property(self, td, name, timeout=None,
+                            qos_publish=QOS_1, qos_subscribe=QOS_1):
         """Reads the value of a Property on a remote Thing.
         Returns a Future."""
 
         timeout = timeout if timeout else self._timeout_default
-        ref_id = uuid.uuid4().hex
-
-        forms = td.get_property_forms(name)
+        ref_id = self._next_id()
 
-        href_read = self._pick_mqtt_href(
-            td, forms,
+        href_read = self._get_mqtt_href(
+            td, td.get_property_forms, name,
             op=InteractionVerbs.READ_PROPERTY)
 
-        href_obsv = self._pick_mqtt_href(
-            td, forms,
+        href_obsv = self._get_mqtt_href(
+            td, td.get_property_forms, name,
             op=InteractionVerbs.OBSERVE_PROPERTY)
 
         if href_read is None or href_obsv is None:
             raise FormNotFoundException()
 
-        parsed_href_read = self._parse_href(href_read)
-        parsed_href_obsv = self._parse_href(href_obsv)
+        parsed_href_read = _parse_href(href_read)
+        parsed_href_obsv = _parse_href(href_obsv)
 
-        topic_read = parsed_href_read["topic"]
-        topic_obsv = parsed_href_obsv["topic"]
+        topic_read = parsed_href_read.topic
+        topic_obsv = parsed_href_obsv.topic
 
-        broker_read = parsed_href_read["broker_url"]
-        broker_obsv = parsed_href_obsv["broker_url"]
+        broker_read = parsed_href_read.broker_url
+        broker_obsv = parsed_href_obsv.broker_url
 
         try:
-            yield self._init_client(broker_read, ref_id)
-            broker_obsv != broker_read and (yield self._init_client(broker_obsv, ref_id))
+            await asyncio.gather(*[
+                self._init_client(broker_url, ref_id)
+                for broker_url in {broker_read, broker_obsv}
+            ])
 
-            yield self._subscribe(broker_obsv, topic_obsv, qos_subscribe)
+            await self._subscribe(broker_obsv, topic_obsv, qos_subscribe)
 
             read_time = time.time()
-            read_payload = json.dumps({"action": "read"}).encode()
+            read_payload = json_dumps({"action": "read"})
 
-            yield self._publish(broker_read, topic_read, read_payload, qos_publish)
+            await self._publish(broker_read, topic_read, read_payload, qos_publish)
 
             ini = time.time()
 
@@ -589,15 +661,17 @@ class MQTTClient(BaseProtocolClient):
                     lambda item: item[2] >= read_time)
 
                 if not msg_match:
-                    yield self._wait_on_message(broker_obsv, topic_obsv)
+                    await self._wait_on_message(broker_obsv, topic_obsv)
                     continue
 
                 msg_id, msg_data, msg_time = msg_match
 
-                raise tornado.gen.Return(msg_data.get("value"))
+                return msg_data.get("value")
         finally:
-            yield self._disconnect_client(broker_read, ref_id)
-            broker_obsv != broker_read and (yield self._disconnect_client(broker_obsv, ref_id))
+            await asyncio.gather(*[
+                self._release_client(broker_url, ref_id)
+                for broker_url in {broker_read, broker_obsv}
+            ])
 
     def _build_subscribe(self, broker_url, topic, next_item_builder, qos):
         """Builds the subscribe function that should be passed when
@@ -613,22 +687,21 @@ class MQTTClient(BaseProtocolClient):
             client = hbmqtt.client.MQTTClient(config=config)
 
             @handle_observer_finalization(observer)
-            @tornado.gen.coroutine
-            def callback():
+            async def callback():
                 self._logr.debug("Subscribing on <{}> to {} with config: {}".format(
                     broker_url, topic, config))
 
-                yield client.connect(broker_url)
-                yield client.subscribe([(topic, qos)])
+                await client.connect(broker_url)
+                await client.subscribe([(topic, qos)])
 
                 while state["active"]:
                     try:
-                        msg = yield client.deliver_message(timeout=self._deliver_timeout_secs)
+                        msg = await client.deliver_message(timeout=self._deliver_timeout_secs)
                     except asyncio.TimeoutError:
                         continue
 
                     try:
-                        msg_data = json.loads(msg.data.decode())
+                        msg_data = json_loads(msg.data)
                         next_item = next_item_builder(msg_data)
                         observer.on_next(next_item)
                     except Exception as ex:
@@ -638,10 +711,9 @@ class MQTTClient(BaseProtocolClient):
             def unsubscribe():
                 """Disconnects from the MQTT broker and stops the message delivering loop."""
 
-                @tornado.gen.coroutine
-                def disconnect():
+                async def disconnect():
                     try:
-                        yield client.disconnect()
+                        await client.disconnect()
                     except Exception as ex:
                         self._logr.warning(
                             "Subscription disconnection error: {}".format(ex))
@@ -660,19 +732,17 @@ class MQTTClient(BaseProtocolClient):
         """Subscribes to property changes on a remote Thing.
         Returns an Observable"""
 
-        forms = td.get_property_forms(name)
-
-        href = self._pick_mqtt_href(
-            td, forms,
+        href = self._get_mqtt_href(
+            td, td.get_property_forms, name,
             op=InteractionVerbs.OBSERVE_PROPERTY)
 
         if href is None:
             raise FormNotFoundException()
 
-        parsed_href = self._parse_href(href)
+        parsed_href = _parse_href(href)
 
-        broker_url = parsed_href["broker_url"]
-        topic = parsed_href["topic"]
+        broker_url = parsed_href.broker_url
+        topic = parsed_href.topic
 
         def next_item_builder(msg_data):
             msg_value = msg_data.get("value")
@@ -692,19 +762,17 @@ class MQTTClient(BaseProtocolClient):
         """Subscribes to an event on a remote Thing.
         Returns an Observable."""
 
-        forms = td.get_event_forms(name)
-
-        href = self._pick_mqtt_href(
-            td, forms,
+        href = self._get_mqtt_href(
+            td, td.get_event_forms, name,
             op=InteractionVerbs.SUBSCRIBE_EVENT)
 
         if href is None:
             raise FormNotFoundException()
 
-        parsed_href = self._parse_href(href)
+        parsed_href = _parse_href(href)
 
-        broker_url = parsed_href["broker_url"]
-        topic = parsed_href["topic"]
+        broker_url = parsed_href.broker_url
+        topic = parsed_href.topic
 
         def next_item_builder(msg_data):
             return EmittedEvent(init=msg_data.get("data"), name=name)
@@ -718,6 +786,16 @@ class MQTTClient(BaseProtocolClient):
         # noinspection PyUnresolvedReferences
         return Observable.create(subscribe)
 
+    @returns_future
+    async def shutdown(self):
+        """Disconnects all the clients that are kept connected to be reused
+        across requests. Clients with requests in progress are disconnected
+        as soon as those requests finish.
+        Returns a Future."""
+
+        for broker_url in list(self._clients.keys()):
+            await self._disconnect_client(broker_url)
+
     def on_td_change(self, url):
         """Subscribes to Thing Description changes on a remote Thing.
         Returns an Observable."""
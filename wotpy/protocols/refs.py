@@ -35,6 +35,11 @@ class ConnRefCounter(object):
         except KeyError:
             self._logr.warning("Attempted to remove unknown reference: {}".format(ref_id))
 
+    def has_ref(self, conn_id, ref_id):
+        """Returns True if the given reference points to the connection."""
+
+        return conn_id in self._counter and ref_id in self._counter[conn_id]
+
     def has_any(self, conn_id):
         """Returns True if the connection has any references pointing to it."""
 
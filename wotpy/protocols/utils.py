@@ -5,6 +5,8 @@
 Utility functions used by client and server implementations.
 """
 
+import weakref
+
 from six.moves import urllib
 
 
@@ -19,7 +21,22 @@ def is_scheme_form(form, base, scheme):
 
     parsed_scheme = urllib.parse.urlparse(resolved_url).scheme
 
-    return parsed_scheme in scheme if isinstance(scheme, list) else parsed_scheme == scheme
+    if isinstance(scheme, (list, tuple, set, frozenset)):
+        return parsed_scheme in scheme
+
+    return parsed_scheme == scheme
+
+
+def is_op_form(form, op):
+    """Returns True if the given Form supports the operation in the op argument
+    (or if op is None). The op field of the Form may be a single value or a collection."""
+
+    if op is None:
+        return True
+
+    form_op = form.op
+
+    return op == form_op or (isinstance(form_op, (list, tuple, set, frozenset)) and op in form_op)
 
 
 def pick_form(td, forms, schemes, op=None):
@@ -38,3 +55,26 @@ def pick_form(td, forms, schemes, op=None):
             return scheme_forms[0]
 
     return None
+
+
+class FormHrefCache(object):
+    """Cache for the Form hrefs that a protocol binding client picks for the
+    interactions of a Thing Description. Entries are kept in a weak mapping
+    so they are discarded along with the Thing Description object."""
+
+    def __init__(self):
+        self._cache = weakref.WeakKeyDictionary()
+
+    def get(self, td, key, pick_href):
+        """Returns the href cached under the given TD and key.
+        The pick_href callable is used to resolve the href on cache misses."""
+
+        td_cache = self._cache.get(td)
+
+        if td_cache is None:
+            td_cache = self._cache[td] = {}
+
+        if key not in td_cache:
+            td_cache[key] = pick_href()
+
+        return td_cache[key]
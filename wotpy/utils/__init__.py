@@ -8,5 +8,6 @@ Utility functions and classes.
     :toctree: _utils
 
     wotpy.utils.enums
+    wotpy.utils.serialization
     wotpy.utils.utils
 """
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+JSON serialization helpers used in the hot paths of the protocol binding clients.
+The faster orjson and simdjson libraries are used when available,
+falling back to the standard json module otherwise.
+"""
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+import json
+
+
+def json_dumps(obj):
+    """Serializes the given object to an UTF8 bytes JSON string."""
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    return json.dumps(obj).encode("utf-8")
+
+
+_WRAPPER_PREFIXES_MAX = 32
+
+_wrapper_prefixes = {}
+
+
+def _wrapper_prefix(key):
+    """Returns the serialized opening of a JSON object with a single key.
+    The prefixes for the first keys are cached, as the clients only use a handful of them."""
+
+    prefix = _wrapper_prefixes.get(key)
+
+    if prefix is None:
+        prefix = b"{" + json_dumps(key) + b":"
+
+        if len(_wrapper_prefixes) < _WRAPPER_PREFIXES_MAX:
+            _wrapper_prefixes[key] = prefix
+
+    return prefix
+
+
+def json_dumps_wrapped(key, value):
+    """Serializes the JSON object {key: value} to an UTF8 bytes JSON string.
+    Only the value is serialized on each call, without building an intermediate dict."""
+
+    return _wrapper_prefix(key) + json_dumps(value) + b"}"
+
+
+def json_loads(data):
+    """Deserializes the given UTF8 bytes, bytearray or unicode JSON string to a Python object.
+    Binary payloads should be passed as they are, without decoding them to unicode first."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def _materialize(value):
+    """Converts a lazy simdjson proxy to the equivalent Python object."""
+
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+
+    return value
+
+
+_simdjson_parser = None
+
+
+def _get_simdjson_parser():
+    """Returns the simdjson parser shared by all calls to json_loads_fields.
+    Building a parser allocates its internal buffers, so it is created only once."""
+
+    global _simdjson_parser
+
+    if _simdjson_parser is None:
+        _simdjson_parser = simdjson.Parser()
+
+    return _simdjson_parser
+
+
+def json_loads_fields(data, keys):
+    """Deserializes a JSON object document and returns a dict that only contains
+    the given top-level keys. orjson is preferred when available as it parses whole
+    documents faster than simdjson builds the requested fields. Otherwise, when simdjson
+    is available the document is parsed on demand and only the requested fields are
+    converted to Python objects."""
+
+    if orjson is not None or simdjson is None:
+        doc = json_loads(data)
+        return {key: doc[key] for key in keys if key in doc}
+
+    doc = _get_simdjson_parser().parse(data)
+
+    return {key: _materialize(doc[key]) for key in keys if key in doc}
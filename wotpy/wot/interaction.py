@@ -7,14 +7,20 @@ Classes that represent all interaction patterns.
 
 from abc import ABCMeta, abstractmethod
 
-# noinspection PyPackageRequirements
-from slugify import slugify
+import six
 
 from wotpy.wot.enums import InteractionTypes
 from wotpy.wot.validation import is_valid_safe_name
 from wotpy.wot.dictionaries.interaction import PropertyFragmentDict, ActionFragmentDict, EventFragmentDict
 
 
+def _intern(name):
+    """Interns the given name if it is a native string.
+    Unicode names are returned as they are on Python 2, where intern() rejects them."""
+
+    return six.moves.intern(name) if isinstance(name, str) else name
+
+
 class InteractionPattern(object):
     """A functionality exposed by Thing that is defined by the TD Interaction Model."""
 
@@ -27,7 +33,8 @@ class InteractionPattern(object):
         self._init_dict = init_dict if init_dict else self.init_class(**kwargs)
 
         self._thing = thing
-        self._name = name
+        self._name = _intern(name)
+        self._url_name = None
         self._forms = []
 
     def __getattr__(self, name):
@@ -66,7 +73,13 @@ class InteractionPattern(object):
     def url_name(self):
         """URL-safe version of the name."""
 
-        return slugify(self.name)
+        if self._url_name is None:
+            # noinspection PyPackageRequirements
+            from slugify import slugify
+
+            self._url_name = _intern(slugify(self.name))
+
+        return self._url_name
 
     @property
     def forms(self):
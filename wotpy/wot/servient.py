@@ -530,10 +530,12 @@ class Servient(object):
 
     @tornado.gen.coroutine
     def shutdown(self):
-        """Stops the server configured under this servient."""
+        """Stops the servers configured under this servient
+        and releases the resources held by its protocol clients."""
 
         with (yield self._servient_lock.acquire()):
             yield [server.stop() for server in six.itervalues(self._servers)]
             self._stop_catalogue()
             yield self._stop_dnssd()
+            yield [client.shutdown() for client in six.itervalues(self._clients)]
             self._is_running = False
@@ -12,7 +12,7 @@ import six
 
 from wotpy.wot.dictionaries.thing import ThingFragment
 from wotpy.wot.thing import Thing
-from wotpy.wot.validation import SCHEMA_THING, InvalidDescription
+from wotpy.wot.validation import validate_thing, InvalidDescription
 
 
 class ThingDescription(object):
@@ -34,7 +34,7 @@ class ThingDescription(object):
         Raises ValidationError if validation fails."""
 
         try:
-            jsonschema.validate(doc, SCHEMA_THING)
+            validate_thing(doc)
         except (jsonschema.ValidationError, TypeError) as ex:
             raise InvalidDescription(str(ex))
 
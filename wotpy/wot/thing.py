@@ -5,12 +5,9 @@
 Class that represents a Thing.
 """
 
-import hashlib
-import itertools
 import uuid
 
 import six
-from slugify import slugify
 
 from wotpy.utils.utils import to_camel
 from wotpy.wot.dictionaries.thing import ThingFragment
@@ -35,11 +32,24 @@ class Thing(object):
 
     assert THING_FRAGMENT_WRITABLE_FIELDS.issubset(ThingFragment.Meta.fields)
 
+    INTERACTION_CLASSES = (Property, Action, Event)
+
+    __slots__ = (
+        "_thing_fragment",
+        "_uuid",
+        "_url_name",
+        "_interactions",
+        "_by_type",
+        "_by_url_name"
+    )
+
     def __init__(self, thing_fragment=None, **kwargs):
         self._thing_fragment = thing_fragment if thing_fragment else ThingFragment(**kwargs)
-        self._properties = {}
-        self._actions = {}
-        self._events = {}
+        self._uuid = None
+        self._url_name = None
+        self._interactions = {}
+        self._by_type = {klass: {} for klass in self.INTERACTION_CLASSES}
+        self._by_url_name = {}
         self._init_fragment_interactions()
 
     def __getattr__(self, name):
@@ -117,92 +127,99 @@ class Thing(object):
     def id(self):
         """Thing ID."""
 
-        return self.thing_fragment.id
+        return self._thing_fragment.id
 
     @property
     def title(self):
         """Thing title."""
 
-        return self.thing_fragment.title
+        return self._thing_fragment.title
 
     @property
     def uuid(self):
         """Thing UUID in hex string format (e.g. a5220c5f-6bcb-4675-9c67-a2b1adc280b7).
-        This value is deterministic and derived from the Thing ID.
+        This value is deterministic and derived from the Thing ID (UUID version 5).
         It may be of use when URL-unsafe chars are not acceptable."""
 
-        hasher = hashlib.md5()
-        hasher.update(self.id.encode())
-        bytes_id_hash = hasher.digest()
+        if self._uuid is None:
+            # uuid5 on Python 2 expects a byte string name, Python 3 encodes it as UTF-8
+            name = self.id.encode("utf-8") if six.PY2 and isinstance(self.id, six.text_type) else self.id
+            self._uuid = str(uuid.uuid5(uuid.NAMESPACE_URL, name))
 
-        return str(uuid.UUID(bytes=bytes_id_hash))
+        return self._uuid
 
     @property
     def url_name(self):
         """Returns the URL-safe name of this Thing.
         The URL name of a Thing is always unique and stable as long as the ID is unique."""
 
-        return slugify("{}-{}".format(self.title, self.uuid))
+        title = self.title
+
+        if self._url_name is None or self._url_name[0] != title:
+            from slugify import slugify
+
+            self._url_name = (title, slugify("{}-{}".format(title, self.uuid)))
+
+        return self._url_name[1]
 
     @property
     def properties(self):
         """Properties interactions."""
 
-        return self._properties
+        return self._by_type[Property]
 
     @property
     def actions(self):
         """Actions interactions."""
 
-        return self._actions
+        return self._by_type[Action]
 
     @property
     def events(self):
         """Events interactions."""
 
-        return self._events
+        return self._by_type[Event]
 
     @property
     def interactions(self):
         """Sequence of interactions linked to this thing."""
 
-        return itertools.chain(
-            self._properties.values(),
-            self._actions.values(),
-            self._events.values())
+        return self._interactions.values()
+
+    @property
+    def interactions_count(self):
+        """Number of interactions linked to this thing."""
+
+        return len(self._interactions)
 
     def find_interaction(self, name):
         """Finds an existing Interaction by name.
         The name argument may be the original name or the URL-safe version."""
 
-        def is_match(intrct):
-            return intrct.name == name or intrct.url_name == name
+        interaction = self._interactions.get(name)
 
-        return next((intrct for intrct in self.interactions if is_match(intrct)), None)
+        return interaction if interaction is not None else self._by_url_name.get(name)
 
     def add_interaction(self, interaction):
         """Add a new Interaction."""
 
-        if not isinstance(interaction, (Property, Event, Action)):
-            raise ValueError("Not an Interaction")
+        type_dict = self._by_type.get(type(interaction))
+
+        if type_dict is None:
+            raise TypeError("Not an Interaction: {}".format(type(interaction).__name__))
 
         if interaction.thing is not self:
             raise ValueError("Interaction linked to another Thing")
 
-        if self.find_interaction(interaction.name) or self.find_interaction(interaction.url_name):
-            raise ValueError("Duplicate Interaction: {}".format(interaction.name))
+        name = interaction.name
+        url_name = interaction.url_name
 
-        interaction_dict_map = {
-            Property: self._properties,
-            Action: self._actions,
-            Event: self._events
-        }
+        if self.find_interaction(name) or self.find_interaction(url_name):
+            raise ValueError("Duplicate Interaction: {}".format(name))
 
-        interaction_class = next(
-            klass for klass in [Property, Action, Event]
-            if isinstance(interaction, klass))
-
-        interaction_dict_map[interaction_class][interaction.name] = interaction
+        self._interactions[name] = interaction
+        type_dict[name] = interaction
+        self._by_url_name[url_name] = interaction
 
     def remove_interaction(self, name):
         """Removes an existing Interaction by name.
@@ -213,6 +230,8 @@ class Thing(object):
         if interaction is None:
             return
 
-        self._properties.pop(interaction.name, None)
-        self._actions.pop(interaction.name, None)
-        self._events.pop(interaction.name, None)
+        name = interaction.name
+
+        self._interactions.pop(name, None)
+        self._by_type[type(interaction)].pop(name, None)
+        self._by_url_name.pop(interaction.url_name, None)
@@ -5,13 +5,23 @@
 Schemas following the JSON Schema specification used to validate the shape of Thing Description documents.
 """
 
+import hashlib
+import json
 import re
+import string
+
+from jsonschema import Draft4Validator, ValidationError, validators
 
 from wotpy.wot.enums import InteractionTypes
 
 REGEX_SAFE_NAME = r"^[a-zA-Z0-9_-]+$"
 REGEX_ANY_URI = r"^((\w+:(\/?\/?)[^\s]+)|((..\/)+)[^\s]*)$"
 
+_SAFE_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+_RE_ANY_URI = re.compile(r"(?:(\w+:(\/?\/?)[^\s]+)|((..\/)+)[^\s]*)\Z")
+_RE_WHITESPACE = re.compile(r"\s")
+_COMMON_URI_PREFIXES = ("http://", "https://", "coap://", "coaps://", "mqtt://", "ws://", "wss://", "file://")
+
 DATA_TYPES_ENUM = [
     "array",
     "boolean",
@@ -262,32 +272,138 @@ SCHEMA_THING = {
     ]
 }
 
+Draft4Validator.check_schema(SCHEMA_THING)
+
+
+def _matches_pattern(pattern, key):
+    """Returns True if the given key matches the given patternProperties pattern.
+    REGEX_SAFE_NAME is checked with is_valid_safe_name, which also follows the
+    ECMA-262 semantics of $ by rejecting keys that end in a newline."""
+
+    if pattern == REGEX_SAFE_NAME:
+        return is_valid_safe_name(key)
+
+    return re.search(pattern, key) is not None
+
+
+def _safe_name_properties(validator, pattern_properties, instance, schema):
+    """patternProperties keyword that checks the keys matched by REGEX_SAFE_NAME
+    with is_valid_safe_name instead of running the regex search for each key."""
+
+    if not validator.is_type(instance, "object"):
+        return
+
+    for pattern, subschema in pattern_properties.items():
+        for key, val in instance.items():
+            if _matches_pattern(pattern, key):
+                for error in validator.descend(val, subschema, path=key, schema_path=pattern):
+                    yield error
+
+
+def _safe_name_additional_properties(validator, additional_properties, instance, schema):
+    """additionalProperties keyword that finds the additional keys
+    with the same pattern matching rules as _safe_name_properties."""
+
+    if not validator.is_type(instance, "object"):
+        return
+
+    properties = schema.get("properties", {})
+    patterns = sorted(schema.get("patternProperties", {}))
+
+    extras = sorted(
+        key for key in instance
+        if key not in properties and not any(_matches_pattern(pattern, key) for pattern in patterns))
+
+    if validator.is_type(additional_properties, "object"):
+        for extra in extras:
+            for error in validator.descend(instance[extra], additional_properties, path=extra):
+                yield error
+    elif not additional_properties and extras:
+        if patterns:
+            yield ValidationError("{} {} not match any of the regexes: {}".format(
+                ", ".join(map(repr, extras)),
+                "does" if len(extras) == 1 else "do",
+                ", ".join(map(repr, patterns))))
+        else:
+            yield ValidationError("Additional properties are not allowed ({} {} unexpected)".format(
+                ", ".join(map(repr, extras)),
+                "was" if len(extras) == 1 else "were"))
+
+
+_ThingValidator = validators.extend(Draft4Validator, {
+    "patternProperties": _safe_name_properties,
+    "additionalProperties": _safe_name_additional_properties
+})
+
+_THING_VALIDATOR = _ThingValidator(SCHEMA_THING)
+
+
+def _fingerprint(schema):
+    """Returns the SHA-256 hex digest of the canonical JSON serialization of the given schema."""
+
+    serialized = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+_SCHEMA_FINGERPRINTS = {
+    id(schema): _fingerprint(schema) for schema in (
+        SCHEMA_DATA_SCHEMA,
+        SCHEMA_SECURITY_SCHEME,
+        SCHEMA_LINK,
+        SCHEMA_FORM,
+        SCHEMA_INTERACTION_PATTERN,
+        SCHEMA_PROPERTY,
+        SCHEMA_EVENT,
+        SCHEMA_ACTION,
+        SCHEMA_VERSIONING,
+        SCHEMA_THING
+    )
+}
+
+_INTERACTION_TYPE_SCHEMAS = {
+    InteractionTypes.PROPERTY: SCHEMA_PROPERTY,
+    InteractionTypes.ACTION: SCHEMA_ACTION,
+    InteractionTypes.EVENT: SCHEMA_EVENT
+}
+
 
 def interaction_schema_for_type(interaction_type):
     """Returns the JSON schema that describes an
     interaction for the given interaction type."""
 
-    type_schema_dict = {
-        InteractionTypes.PROPERTY: SCHEMA_PROPERTY,
-        InteractionTypes.ACTION: SCHEMA_ACTION,
-        InteractionTypes.EVENT: SCHEMA_EVENT
-    }
+    return _INTERACTION_TYPE_SCHEMAS[interaction_type]
+
 
-    assert interaction_type in type_schema_dict
+def validate_thing(doc):
+    """Validates the given Thing Description document against SCHEMA_THING using
+    a validator that is built once. Raises jsonschema.ValidationError if validation fails."""
 
-    return type_schema_dict[interaction_type]
+    _THING_VALIDATOR.validate(doc)
+
+
+def schema_fingerprint(schema):
+    """Returns a content hash of the given schema that is stable across processes.
+    Only defined for the SCHEMA_* constants in this module, returns None otherwise."""
+
+    return _SCHEMA_FINGERPRINTS.get(id(schema))
 
 
 def is_valid_uri(val):
-    """Returns True if the given value is a valid URI."""
+    """Returns True if the given value is a valid URI.
+    URIs with a common scheme and no whitespace are accepted without evaluating REGEX_ANY_URI."""
+
+    if val.startswith(_COMMON_URI_PREFIXES) and _RE_WHITESPACE.search(val) is None:
+        return True
 
-    return False if re.match(REGEX_ANY_URI, val) is None else True
+    return _RE_ANY_URI.match(val) is not None
 
 
 def is_valid_safe_name(val):
-    """Returns True if the given value is a safe machine-readable name."""
+    """Returns True if the given value is a safe machine-readable name.
+    Equivalent to matching REGEX_SAFE_NAME, without going through the regex engine."""
 
-    return False if re.match(REGEX_SAFE_NAME, val) is None else True
+    return bool(val) and _SAFE_NAME_CHARS.issuperset(val)
 
 
 class InvalidDescription(Exception):